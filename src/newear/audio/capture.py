@@ -2,9 +2,10 @@
 
 import sounddevice as sd
 import numpy as np
+import math
 import threading
-import queue
 import time
+from collections import deque
 from typing import Optional, Callable, Generator
 from dataclasses import dataclass
 
@@ -36,10 +37,22 @@ class AudioCapture:
             )
         else:
             self.config = config or AudioConfig()
+        self._is_mono = self.config.channels == 1
         self.device_manager = AudioDevices()
         self.device: Optional[AudioDevice] = None
         self.stream: Optional[sd.InputStream] = None
-        self.audio_queue = queue.Queue()
+        # deque append/popleft are atomic, so the realtime audio callback
+        # never blocks on a mutex handing blocks to the consumer. Bounded to
+        # about two chunks of audio: when transcription falls behind, the
+        # oldest blocks are dropped so memory and latency stay bounded.
+        max_blocks = math.ceil(
+            2 * self.config.sample_rate * self.config.chunk_duration / self.config.buffer_size
+        )
+        self.audio_queue: deque = deque(maxlen=max(1, max_blocks))
+        self._data_event = threading.Event()
+        self.dropped_blocks = 0
+        # Blocks dropped before anything consumed chunks (e.g. model still loading)
+        self.startup_dropped_blocks = 0
         self.is_capturing = False
         self._capture_thread: Optional[threading.Thread] = None
         
@@ -71,14 +84,18 @@ class AudioCapture:
         if status:
             print(f"Audio callback status: {status}")
         
-        # Convert to mono if stereo
-        if indata.shape[1] > 1:
-            audio_data = np.mean(indata, axis=1, keepdims=True)
+        # Copy out (sounddevice reuses indata), downmixing to mono if needed
+        if self._is_mono:
+            audio_data = indata.reshape(-1).copy()
         else:
-            audio_data = indata
+            audio_data = indata.mean(axis=1, dtype=np.float32)
         
-        # Put audio data in queue
-        self.audio_queue.put(audio_data.flatten())
+        # Put audio data in queue, the deque evicts the oldest block when full
+        if len(self.audio_queue) == self.audio_queue.maxlen:
+            self.dropped_blocks += 1
+        self.audio_queue.append(audio_data)
+        if not self._data_event.is_set():
+            self._data_event.set()
     
     def start_capture(self) -> bool:
         """Start audio capture."""
@@ -123,6 +140,10 @@ class AudioCapture:
             self.stream = None
         
         print("Audio capture stopped")
+        if self.startup_dropped_blocks:
+            print(f"Dropped {self.startup_dropped_blocks} audio blocks before transcription started")
+        if self.dropped_blocks:
+            print(f"Dropped {self.dropped_blocks} audio blocks while transcription was behind")
     
     def start(self):
         """Start audio capture and begin processing."""
@@ -133,7 +154,7 @@ class AudioCapture:
         try:
             for chunk in self.get_audio_chunks():
                 if chunk is not None:
-                    rms = np.sqrt(np.mean(chunk ** 2))
+                    rms = math.sqrt(float(chunk @ chunk) / chunk.size) if chunk.size else 0.0
                     if rms > 0.001:  # Only show when there's actual audio
                         print(f"Audio detected: RMS = {rms:.6f}")
         except KeyboardInterrupt:
@@ -147,28 +168,59 @@ class AudioCapture:
     def get_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """Get a single audio chunk from the queue."""
         try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self.audio_queue.popleft()
+        except IndexError:
+            pass
+        
+        # Clear, then re-check so a block appended in between isn't missed
+        self._data_event.clear()
+        try:
+            return self.audio_queue.popleft()
+        except IndexError:
+            pass
+        
+        if not self._data_event.wait(timeout):
+            return None
+        try:
+            return self.audio_queue.popleft()
+        except IndexError:
             return None
     
     def get_audio_chunks(self) -> Generator[np.ndarray, None, None]:
         """Generator that yields audio chunks continuously."""
         chunk_size = int(self.config.sample_rate * self.config.chunk_duration)
-        audio_buffer = np.array([], dtype=np.float32)
+        # Preallocated accumulation buffer with a write index, instead of
+        # growing a new array with np.concatenate on every callback block
+        audio_buffer = np.empty(2 * chunk_size, dtype=np.float32)
+        write_index = 0
+        
+        # Overflow before the consumer started isn't transcription lag
+        self.startup_dropped_blocks += self.dropped_blocks
+        self.dropped_blocks = 0
         
         while self.is_capturing:
             # Get audio data from queue
             try:
-                chunk = self.audio_queue.get(timeout=0.1)
-                audio_buffer = np.concatenate([audio_buffer, chunk])
+                chunk = self.get_audio_chunk(timeout=0.1)
+                if chunk is None:
+                    continue
+                n = len(chunk)
+                if write_index + n > len(audio_buffer):
+                    # Block larger than the spare room, grow once to fit
+                    grown = np.empty(write_index + n + chunk_size, dtype=np.float32)
+                    grown[:write_index] = audio_buffer[:write_index]
+                    audio_buffer = grown
+                audio_buffer[write_index:write_index + n] = chunk
+                write_index += n
                 
                 # Yield chunks of the desired size
-                while len(audio_buffer) >= chunk_size:
-                    yield audio_buffer[:chunk_size]
-                    audio_buffer = audio_buffer[chunk_size:]
+                while write_index >= chunk_size:
+                    # Copy out, the buffer is reused for the next chunk
+                    yield audio_buffer[:chunk_size].copy()
+                    remaining = write_index - chunk_size
+                    audio_buffer[:remaining] = audio_buffer[chunk_size:write_index]
+                    write_index = remaining
                     
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"Error in audio chunk generator: {e}")
                 break
@@ -191,7 +243,7 @@ class AudioCapture:
                 chunk = self.get_audio_chunk(timeout=0.5)
                 if chunk is not None:
                     chunk_count += 1
-                    rms = np.sqrt(np.mean(chunk ** 2))
+                    rms = math.sqrt(float(chunk @ chunk) / chunk.size) if chunk.size else 0.0
                     print(f"Chunk {chunk_count}: RMS level = {rms:.6f}")
                 else:
                     print("No audio data received")
@@ -1,9 +1,16 @@
 """Audio device detection and management for macOS."""
 
 import sounddevice as sd
+import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Seconds a PortAudio device query stays valid
+DEVICE_CACHE_TTL = 2.0
+
+_device_cache: Tuple["AudioDevice", ...] = ()
+_device_cache_time: float = 0.0
+
 
 @dataclass
 class AudioDevice:
@@ -23,7 +30,13 @@ class AudioDevices:
         self.devices = self._get_devices()
         
     def _get_devices(self) -> List[AudioDevice]:
-        """Get all available audio devices."""
+        """Get all available audio devices, reusing a recent query."""
+        global _device_cache, _device_cache_time
+        
+        now = time.monotonic()
+        if _device_cache and now - _device_cache_time < DEVICE_CACHE_TTL:
+            return list(_device_cache)
+        
         devices = []
         device_list = sd.query_devices()
         
@@ -37,8 +50,17 @@ class AudioDevices:
                 hostapi=device['hostapi']
             ))
         
+        _device_cache = tuple(devices)
+        _device_cache_time = now
         return devices
     
+    @staticmethod
+    def invalidate_cache():
+        """Force the next lookup to query PortAudio again."""
+        global _device_cache, _device_cache_time
+        _device_cache = ()
+        _device_cache_time = 0.0
+    
     def find_blackhole_device(self) -> Optional[AudioDevice]:
         """Find BlackHole virtual audio device."""
         for device in self.devices:
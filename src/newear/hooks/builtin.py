@@ -1,29 +1,336 @@
 """Built-in hooks for common post-transcription actions."""
 
-import json
+import atexit
+import os
+import sqlite3
+import string
 import subprocess
-from typing import Dict, Any, Optional
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from .manager import Hook
 from .types import HookContext, HookResult
 
+__all__ = [
+    'ConsoleLogHook',
+    'FileAppendHook',
+    'CommandHook',
+    'WebhookHook',
+    'TranslationHook',
+    'OpenAITranslationHook',
+    'TRANSLATION_CACHE_PATH',
+    'clear_translation_cache',
+    'translation_cache_paths',
+]
+
+# Where translations persist between runs when persistent_cache is enabled
+TRANSLATION_CACHE_PATH = Path.home() / ".newear" / "cache" / "translations.db"
+
+# Keep-alive session shared by webhook hooks, created on first use
+_webhook_session: Optional["requests.Session"] = None
+_webhook_session_lock = threading.Lock()
+
+
+def _get_webhook_session() -> Optional["requests.Session"]:
+    """Get the shared HTTP session so connections and TLS state are reused.
+    
+    requests is imported here, so configs without webhooks never load it.
+    Returns None when requests is not installed. Failed POSTs are not
+    retried, since a retry could deliver the same result twice.
+    """
+    global _webhook_session
+    if _webhook_session is None:
+        with _webhook_session_lock:
+            if _webhook_session is None:
+                try:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                except ImportError:
+                    return None
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _webhook_session = session
+    return _webhook_session
+
+
+_formatter = string.Formatter()
+
+# Parsed format string: (literal, field_name, format_spec, conversion) tuples
+Template = List[Tuple[str, Optional[str], Optional[str], Optional[str]]]
+
+
+def _compile_template(template: str) -> Template:
+    """Parse a ``str.format`` template once so it can be rendered per chunk."""
+    return list(_formatter.parse(template))
+
+
+def _render_template(template: Template, values: Dict[str, Any]) -> str:
+    """Render a compiled template; equivalent to ``template.format(**values)``."""
+    parts = []
+    for literal, field_name, format_spec, conversion in template:
+        parts.append(literal)
+        if field_name is not None:
+            if field_name in values:
+                value = values[field_name]
+            else:
+                # Auto-numbered fields ("{}", "{[0]}") are positional, and
+                # there are no positional arguments, as with str.format
+                if not field_name or field_name[0] in '.[':
+                    field_name = '0' + field_name
+                value = _formatter.get_field(field_name, (), values)[0]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+    return ''.join(parts)
+
+
+def _compile_command(command: Union[str, List[str]]) -> Tuple[bool, Any]:
+    """Compile a hook command into ``(use_shell, template(s))``.
+    
+    A list is treated as an argv and run without a shell, which lets
+    subprocess use posix_spawn instead of forking the interpreter and keeps
+    transcribed text from being parsed by the shell. A string is run through
+    the shell as before, for commands that need pipes or redirection.
+    """
+    if isinstance(command, (list, tuple)):
+        return False, [_compile_template(str(arg)) for arg in command]
+    return True, _compile_template(command)
+
+
+def _run_command(compiled: Tuple[bool, Any], values: Dict[str, Any],
+                 timeout: float) -> Tuple[subprocess.CompletedProcess, str]:
+    """Fill placeholders in a compiled hook command and run it."""
+    use_shell, template = compiled
+    if not use_shell:
+        argv = [_render_template(arg, values) for arg in template]
+        result = subprocess.run(
+            argv,
+            shell=False,
+            close_fds=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result, " ".join(argv)
+    
+    command = _render_template(template, values)
+    result = subprocess.run(
+        command,
+        shell=True,
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    return result, command
+
+
+class _TranslationStore:
+    """SQLite table of translations that survives restarts.
+    
+    Entries are scoped by a namespace (model and target language) and expire
+    after ttl seconds. Expired rows are deleted when the store is opened, and
+    the table is trimmed to max_rows by dropping the oldest entries.
+    """
+    
+    def __init__(self, path: Path, namespace: str, ttl: float, max_rows: int = 50000):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "namespace TEXT NOT NULL, source TEXT NOT NULL, translated TEXT NOT NULL, "
+            "created REAL NOT NULL, PRIMARY KEY (namespace, source))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS translations_created ON translations (created)"
+        )
+        self._prune()
+        self._conn.commit()
+    
+    def _prune(self):
+        """Delete expired rows and the oldest rows beyond max_rows."""
+        self._conn.execute(
+            "DELETE FROM translations WHERE created < ?", (time.time() - self.ttl,)
+        )
+        excess = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_rows
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM translations WHERE rowid IN "
+                "(SELECT rowid FROM translations ORDER BY created LIMIT ?)",
+                (excess,)
+            )
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return an unexpired translation for key, if stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translated FROM translations "
+                "WHERE namespace = ? AND source = ? AND created >= ?",
+                (self.namespace, key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key: str, translated: str):
+        """Store or refresh a translation."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)",
+                (self.namespace, key, translated, time.time())
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _translation_cache_path(config: Dict[str, Any]) -> Path:
+    """Resolve a translation hook's cache_path setting."""
+    return Path(config.get('cache_path', TRANSLATION_CACHE_PATH)).expanduser()
+
+
+def translation_cache_paths(hooks: List[Dict[str, Any]]) -> List[Path]:
+    """Every translation cache location: the default plus configured cache_paths."""
+    paths = [TRANSLATION_CACHE_PATH]
+    for hook in hooks:
+        if hook.get('type') == 'openai_translation':
+            path = _translation_cache_path(hook.get('config') or {})
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def clear_translation_cache(path: Path = TRANSLATION_CACHE_PATH) -> bool:
+    """Delete the persistent translation cache. Returns False if there was none."""
+    removed = False
+    for suffix in ("", "-wal", "-shm"):
+        cache_file = Path(f"{path}{suffix}")
+        if cache_file.exists():
+            cache_file.unlink()
+            removed = True
+    return removed
+
+
+class _TranslationCache:
+    """Small LRU of translations keyed on whitespace-normalized source text.
+    
+    Live captions repeat short phrases constantly, so hits skip the
+    translation command or API round trip entirely. With a store, misses
+    fall back to translations saved by earlier runs; open_store is called on
+    first use, so the database isn't touched until a translation is needed.
+    """
+    
+    def __init__(self, maxsize: int = 2048,
+                 open_store: Optional[Callable[[], Optional[_TranslationStore]]] = None):
+        self.maxsize = maxsize
+        self.store: Optional[_TranslationStore] = None
+        self._open_store = open_store
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(text: str) -> str:
+        # Whitespace only; case can change the meaning ("US" / "us")
+        return " ".join(text.split())
+    
+    def _get_store(self) -> Optional[_TranslationStore]:
+        """Return the persistent store, opening it on first call."""
+        if self._open_store is not None:
+            with self._lock:
+                if self._open_store is not None:
+                    self.store = self._open_store()
+                    self._open_store = None
+        return self.store
+    
+    def get(self, text: str) -> Optional[str]:
+        """Return the cached translation for text, if any."""
+        if self.maxsize <= 0:
+            return None
+        key = self._key(text)
+        with self._lock:
+            translated = self._entries.get(key)
+            if translated is not None:
+                self._entries.move_to_end(key)
+                return translated
+        
+        store = self._get_store()
+        if store is not None:
+            translated = store.get(key)
+            if translated is not None:
+                self._remember(key, translated)
+        return translated
+    
+    def put(self, text: str, translated: str):
+        """Store a translation, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        key = self._key(text)
+        self._remember(key, translated)
+        store = self._get_store()
+        if store is not None:
+            store.put(key, translated)
+    
+    def _remember(self, key: str, translated: str):
+        """Add an entry to the in-memory LRU."""
+        with self._lock:
+            self._entries[key] = translated
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def close(self):
+        """Close the persistent store, if any."""
+        self._open_store = None
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+
+def _write_line(line: str):
+    """Write one line to stdout in a single call.
+    
+    Hooks may run concurrently; unlike print(), which writes the text and the
+    newline separately, this keeps lines from different hooks from interleaving.
+    """
+    sys.stdout.write(line + '\n')
+
 
 class ConsoleLogHook(Hook):
     """Hook that logs transcription results to console."""
     
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        # Pick the formatter once; confidence is only read when it is shown
+        if self.config.get('show_confidence', False):
+            self._format = self._format_with_confidence
+        else:
+            self._format = self._format_plain
+    
+    @staticmethod
+    def _format_plain(context: HookContext) -> str:
+        return "📝 " + context.text
+    
+    @staticmethod
+    def _format_with_confidence(context: HookContext) -> str:
+        return f"📝 [{context.transcription_result.confidence:.2f}] {context.text}"
+    
     def execute(self, context: HookContext) -> HookResult:
         """Log the transcription result to console."""
         try:
-            text = context.transcription_result.text.strip()
-            confidence = context.transcription_result.confidence
-            
-            # Format the log message
-            if self.config.get('show_confidence', False):
-                message = f"[{confidence:.2f}] {text}"
-            else:
-                message = text
+            text = context.text
             
             # Log to console
-            print(f"📝 {message}")
+            _write_line(self._format(context))
             
             return HookResult(
                 success=True,
@@ -38,32 +345,63 @@ class ConsoleLogHook(Hook):
 
 
 class FileAppendHook(Hook):
-    """Hook that appends transcription results to a file."""
+    """Hook that appends transcription results to a file.
+    
+    The file stays open with a 64KB buffer. A background thread flushes
+    pending lines every ``flush_interval`` seconds (default 5), including
+    during silence, and the file is flushed on close. A ``flush_interval``
+    of 0 flushes after every line. Set ``fsync_every_n`` to force entries to
+    disk every N writes.
+    """
+    
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        self._file_path = self.config.get('file_path', 'hooks.log')
+        self._template = _compile_template(self.config.get('format', '{text}'))
+        self._flush_interval = self.config.get('flush_interval', 5.0)
+        self._fsync_every_n = self.config.get('fsync_every_n', 0)
+        self._file_handle = None
+        self._writes_since_fsync = 0
+        # Guards the handle against the flusher thread and concurrent executes
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flusher_stop: Optional[threading.Event] = None
     
     def execute(self, context: HookContext) -> HookResult:
         """Append the transcription result to a file."""
         try:
-            file_path = self.config.get('file_path', 'hooks.log')
-            format_str = self.config.get('format', '{text}')
-            
-            text = context.transcription_result.text.strip()
+            text = context.text
             
             # Format the text
-            formatted_text = format_str.format(
-                text=text,
-                confidence=context.transcription_result.confidence,
-                chunk_index=context.chunk_index,
-                timestamp=context.transcription_result.start_time
-            )
+            formatted_text = _render_template(self._template, {
+                'text': text,
+                'confidence': context.transcription_result.confidence,
+                'chunk_index': context.chunk_index,
+                'timestamp': context.transcription_result.start_time
+            })
             
-            # Append to file
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write(formatted_text + '\n')
+            # Append to the persistent, buffered handle
+            with self._lock:
+                if self._file_handle is None:
+                    self._open()
+                self._file_handle.write(formatted_text + '\n')
+                
+                if self._flush_interval <= 0:
+                    self._file_handle.flush()
+                else:
+                    self._dirty = True
+                
+                if self._fsync_every_n:
+                    self._writes_since_fsync += 1
+                    if self._writes_since_fsync >= self._fsync_every_n:
+                        self._file_handle.flush()
+                        os.fsync(self._file_handle.fileno())
+                        self._writes_since_fsync = 0
             
             return HookResult(
                 success=True,
-                message=f"Appended to {file_path}",
-                data={'file_path': file_path}
+                message=f"Appended to {self._file_path}",
+                data={'file_path': self._file_path}
             )
             
         except Exception as e:
@@ -71,31 +409,70 @@ class FileAppendHook(Hook):
                 success=False,
                 error=f"Failed to append to file: {str(e)}"
             )
+    
+    def _open(self):
+        """Open the file and start the periodic flusher (lock held)."""
+        self._file_handle = open(self._file_path, 'a', encoding='utf-8', buffering=64 * 1024)
+        atexit.register(self.close)
+        if self._flush_interval > 0:
+            self._flusher_stop = threading.Event()
+            threading.Thread(
+                target=self._flush_loop,
+                args=(self._flusher_stop,),
+                name=f"hook-flush-{self.name}",
+                daemon=True
+            ).start()
+    
+    def _flush_loop(self, stop: threading.Event):
+        """Flush pending lines every flush_interval seconds until closed."""
+        while not stop.wait(self._flush_interval):
+            with self._lock:
+                if self._dirty and self._file_handle is not None:
+                    try:
+                        self._file_handle.flush()
+                    except OSError as e:
+                        self.logger.warning("Failed to flush %s: %s", self._file_path, e)
+                    self._dirty = False
+    
+    def close(self):
+        """Flush buffered entries and close the file."""
+        with self._lock:
+            if self._flusher_stop is not None:
+                self._flusher_stop.set()
+                self._flusher_stop = None
+            if self._file_handle is not None:
+                self._file_handle.close()
+                self._file_handle = None
+            self._dirty = False
 
 
 class CommandHook(Hook):
-    """Hook that executes a shell command with transcription text."""
+    """Hook that executes a command with transcription text.
+    
+    ``command`` may be an argv list such as ``["notify-send", "{text}"]``,
+    which runs without a shell and is much cheaper to spawn; the older
+    shell-string form is still accepted.
+    """
+    
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        self._command = _compile_command(self.config.get('command', ['echo', '{text}']))
+        self._timeout = self.config.get('timeout', 30)
     
     def execute(self, context: HookContext) -> HookResult:
-        """Execute a shell command with transcription text."""
+        """Execute a command with transcription text."""
         try:
-            command_template = self.config.get('command', 'echo "{text}"')
-            text = context.transcription_result.text.strip()
-            
-            # Replace placeholders in command
-            command = command_template.format(
-                text=text,
-                confidence=context.transcription_result.confidence,
-                chunk_index=context.chunk_index
-            )
+            text = context.text
             
-            # Execute command
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=self.config.get('timeout', 30)
+            # Replace placeholders and execute command
+            result, command = _run_command(
+                self._command,
+                {
+                    'text': text,
+                    'confidence': context.transcription_result.confidence,
+                    'chunk_index': context.chunk_index
+                },
+                self._timeout
             )
             
             if result.returncode == 0:
@@ -129,13 +506,25 @@ class CommandHook(Hook):
 class WebhookHook(Hook):
     """Hook that sends transcription results to a webhook URL."""
     
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        self._url = self.config.get('url')
+        self._timeout = self.config.get('timeout', 10)
+        # Add custom headers if configured
+        self._headers = dict(self.config.get('headers') or {})
+        self._headers.setdefault('Content-Type', 'application/json')
+    
     def execute(self, context: HookContext) -> HookResult:
         """Send transcription result to webhook."""
         try:
-            import requests
+            session = _get_webhook_session()
+            if session is None:
+                return HookResult(
+                    success=False,
+                    error="requests library not available for webhook hook"
+                )
             
-            url = self.config.get('url')
-            if not url:
+            if not self._url:
                 return HookResult(
                     success=False,
                     error="No webhook URL configured"
@@ -143,22 +532,18 @@ class WebhookHook(Hook):
             
             # Prepare payload
             payload = {
-                'text': context.transcription_result.text.strip(),
+                'text': context.text,
                 'confidence': context.transcription_result.confidence,
                 'chunk_index': context.chunk_index,
                 'timestamp': context.transcription_result.start_time
             }
             
-            # Add custom headers if configured
-            headers = self.config.get('headers', {})
-            headers.setdefault('Content-Type', 'application/json')
-            
-            # Send request
-            response = requests.post(
-                url,
+            # Send request over the shared keep-alive session
+            response = session.post(
+                self._url,
                 json=payload,
-                headers=headers,
-                timeout=self.config.get('timeout', 10)
+                headers=self._headers,
+                timeout=self._timeout
             )
             
             if response.status_code == 200:
@@ -173,11 +558,6 @@ class WebhookHook(Hook):
                     error=f"Webhook failed with status {response.status_code}: {response.text}"
                 )
                 
-        except ImportError:
-            return HookResult(
-                success=False,
-                error="requests library not available for webhook hook"
-            )
         except Exception as e:
             return HookResult(
                 success=False,
@@ -186,57 +566,66 @@ class WebhookHook(Hook):
 
 
 class TranslationHook(Hook):
-    """Hook that translates transcription text using AI or translation service."""
+    """Hook that translates transcription text using AI or translation service.
+    
+    With ``service: command``, ``command`` may be an argv list such as
+    ``["trans", "-brief", "en:{target_language}", "{text}"]`` (run without a
+    shell) or a shell string. Repeated phrases are served from an in-memory
+    cache of ``cache_size`` entries (default 2048, 0 disables it).
+    """
+    
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        self._command = _compile_command(
+            self.config.get('command', ['echo', 'Translation: {text}'])
+        )
+        self._target_language = self.config.get('target_language', 'en')
+        self._service = self.config.get('service', 'command')
+        self._timeout = self.config.get('timeout', 30)
+        self._print_translation = self.config.get('print_translation', True)
+        self._cache = _TranslationCache(self.config.get('cache_size', 2048))
     
     def execute(self, context: HookContext) -> HookResult:
         """Translate the transcription text."""
         try:
-            text = context.transcription_result.text.strip()
-            target_language = self.config.get('target_language', 'en')
-            service = self.config.get('service', 'command')
+            text = context.text
+            target_language = self._target_language
             
-            if service == 'command':
-                # Use a command-line translation tool
-                command_template = self.config.get('command', 'echo "Translation: {text}"')
-                command = command_template.format(
-                    text=text,
-                    target_language=target_language
-                )
+            if self._service == 'command':
+                translated_text = self._cache.get(text)
+                if translated_text is None:
+                    # Use a command-line translation tool
+                    result, _ = _run_command(
+                        self._command,
+                        {'text': text, 'target_language': target_language},
+                        self._timeout
+                    )
+                    if result.returncode != 0:
+                        return HookResult(
+                            success=False,
+                            error=f"Translation command failed: {result.stderr}"
+                        )
+                    translated_text = result.stdout.strip()
+                    self._cache.put(text, translated_text)
                 
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.config.get('timeout', 30)
-                )
+                # Log translation
+                if self._print_translation:
+                    _write_line(f"🌍 [{target_language}] {translated_text}")
                 
-                if result.returncode == 0:
-                    translated_text = result.stdout.strip()
-                    
-                    # Log translation
-                    if self.config.get('print_translation', True):
-                        print(f"🌍 [{target_language}] {translated_text}")
-                    
-                    return HookResult(
-                        success=True,
-                        message=f"Translated to {target_language}",
-                        data={
-                            'original': text,
-                            'translated': translated_text,
-                            'target_language': target_language
-                        }
-                    )
-                else:
-                    return HookResult(
-                        success=False,
-                        error=f"Translation command failed: {result.stderr}"
-                    )
+                return HookResult(
+                    success=True,
+                    message=f"Translated to {target_language}",
+                    data={
+                        'original': text,
+                        'translated': translated_text,
+                        'target_language': target_language
+                    }
+                )
             
             else:
                 return HookResult(
                     success=False,
-                    error=f"Unsupported translation service: {service}"
+                    error=f"Unsupported translation service: {self._service}"
                 )
                 
         except Exception as e:
@@ -247,62 +636,105 @@ class TranslationHook(Hook):
 
 
 class OpenAITranslationHook(Hook):
-    """Hook that translates transcription text using OpenAI API."""
+    """Hook that translates transcription text using OpenAI API.
+    
+    Repeated phrases are served from an in-memory cache of ``cache_size``
+    entries (default 2048, 0 disables it) without calling the API. Opting in
+    with ``persistent_cache: true`` also keeps source text and translations
+    on disk in ``cache_path`` (default ~/.newear/cache/translations.db) for
+    ``cache_ttl_days`` (default 30), up to ``cache_max_rows`` entries
+    (default 50000), so restarts don't pay for them again.
+    """
+    
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        self._target_language = self.config.get('target_language', 'Chinese')
+        self._model = self.config.get('model', 'gpt-3.5-turbo')
+        self._api_key = self.config.get('api_key')
+        self._base_url = self.config.get('base_url')  # For providers like OpenRouter
+        self._max_tokens = self.config.get('max_tokens', 1000)
+        self._temperature = self.config.get('temperature', 0.3)
+        output_prefix = self.config.get('output_prefix', '')
+        self._line_prefix = f"[{self._target_language}] "
+        if output_prefix:
+            self._line_prefix = f"{output_prefix} {self._line_prefix}"
+        if not self.config.get('print_translation', True):
+            self._show_translation = self._skip_translation
+        # Built on first use and reused so its connection pool stays warm
+        self._client = None
+        self._system_prompt = (
+            "You are a professional translator. Translate the following text to "
+            f"{self._target_language}. "
+            "Only return the translated text, no explanations."
+        )
+        # The store is opened on the first cache lookup, which only happens
+        # once an API key is configured
+        self._cache = _TranslationCache(
+            self.config.get('cache_size', 2048),
+            self._open_store
+        )
     
     def execute(self, context: HookContext) -> HookResult:
         """Translate the transcription text using OpenAI."""
         try:
-            text = context.transcription_result.text.strip()
-            target_language = self.config.get('target_language', 'Chinese')
-            model = self.config.get('model', 'gpt-3.5-turbo')
-            api_key = self.config.get('api_key')
-            base_url = self.config.get('base_url')  # For providers like OpenRouter
+            text = context.text
+            target_language = self._target_language
+            model = self._model
             
-            if not api_key:
+            if not self._api_key:
                 return HookResult(
                     success=False,
                     error="API key not configured"
                 )
             
-            # Import OpenAI client
-            try:
-                from openai import OpenAI
-            except ImportError:
+            translated_text = self._cache.get(text)
+            if translated_text is not None:
+                self._show_translation(translated_text)
                 return HookResult(
-                    success=False,
-                    error="OpenAI library not installed. Install with: pip install openai"
+                    success=True,
+                    message=f"Translated to {target_language} (cached)",
+                    data={
+                        'original': text,
+                        'translated': translated_text,
+                        'target_language': target_language,
+                        'model': model,
+                        'usage': None,
+                        'cached': True
+                    }
                 )
             
-            # Initialize OpenAI client with optional base_url
-            client_kwargs = {'api_key': api_key}
-            if base_url:
-                client_kwargs['base_url'] = base_url
-            
-            client = OpenAI(**client_kwargs)
-            
-            # Create translation prompt
-            system_prompt = f"You are a professional translator. Translate the following text to {target_language}. Only return the translated text, no explanations."
+            if self._client is None:
+                # Import OpenAI client
+                try:
+                    from openai import OpenAI
+                except ImportError:
+                    return HookResult(
+                        success=False,
+                        error="OpenAI library not installed. Install with: pip install openai"
+                    )
+                
+                # Initialize OpenAI client with optional base_url
+                client_kwargs = {'api_key': self._api_key}
+                if self._base_url:
+                    client_kwargs['base_url'] = self._base_url
+                
+                self._client = OpenAI(**client_kwargs)
             
             # Call OpenAI API
-            response = client.chat.completions.create(
+            response = self._client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": self._system_prompt},
                     {"role": "user", "content": text}
                 ],
-                max_tokens=self.config.get('max_tokens', 1000),
-                temperature=self.config.get('temperature', 0.3)
+                max_tokens=self._max_tokens,
+                temperature=self._temperature
             )
             
             translated_text = response.choices[0].message.content.strip()
+            self._cache.put(text, translated_text)
             
-            # Log translation
-            if self.config.get('print_translation', True):
-                prefix = self.config.get('output_prefix', '')
-                if prefix:
-                    print(f"{prefix} [{target_language}] {translated_text}")
-                else:
-                    print(f"[{target_language}] {translated_text}")
+            self._show_translation(translated_text)
             
             return HookResult(
                 success=True,
@@ -321,3 +753,32 @@ class OpenAITranslationHook(Hook):
                 success=False,
                 error=f"Failed to translate with OpenAI: {str(e)}"
             )
+    
+    def _open_store(self) -> Optional[_TranslationStore]:
+        """Open the persistent translation cache if enabled."""
+        # Off unless asked for: the store writes transcribed speech to disk
+        if not self.config.get('persistent_cache', False) or self.config.get('cache_size', 2048) <= 0:
+            return None
+        try:
+            return _TranslationStore(
+                _translation_cache_path(self.config),
+                # Versioned so rows saved with the old case-folded keys are ignored
+                namespace=f"v2|{self._model}|{self._target_language}",
+                ttl=self.config.get('cache_ttl_days', 30) * 86400,
+                max_rows=self.config.get('cache_max_rows', 50000)
+            )
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning("Persistent translation cache unavailable: %s", e)
+            return None
+    
+    def close(self):
+        """Close the persistent translation cache."""
+        self._cache.close()
+    
+    def _show_translation(self, translated_text: str):
+        """Log translation."""
+        _write_line(self._line_prefix + translated_text)
+    
+    @staticmethod
+    def _skip_translation(translated_text: str):
+        """Used instead of _show_translation when print_translation is off."""
@@ -62,7 +62,7 @@ class HookFactory:
                 # Log error but continue processing other hooks
                 from newear.utils.logging import get_logger
                 logger = get_logger()
-                logger.error(f"Failed to create hook: {e}")
+                logger.error("Failed to create hook: %s", e)
         
         return hooks
     
@@ -1,11 +1,20 @@
 """Hook manager for post-transcription actions."""
 
+import queue
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Optional, Tuple
 from newear.utils.logging import get_logger
 from .types import HookContext, HookResult
 
+# Seconds to wait for a hook that doesn't configure its own timeout
+DEFAULT_HOOK_TIMEOUT = 30.0
+
+# Sentinel that tells the dispatcher thread to exit
+_STOP = object()
+
 
 class Hook(ABC):
     """Abstract base class for hooks."""
@@ -13,6 +22,7 @@ class Hook(ABC):
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         self.name = name
         self.config = config or {}
+        self.min_confidence = self.config.get('min_confidence', 0.0)
         self.logger = get_logger()
     
     @abstractmethod
@@ -23,61 +33,206 @@ class Hook(ABC):
     def is_enabled(self) -> bool:
         """Check if the hook is enabled."""
         return self.config.get('enabled', True)
+    
+    def should_run(self, context: HookContext) -> bool:
+        """Check whether the hook should run for this transcription."""
+        return context.transcription_result.confidence >= self.min_confidence
+    
+    def close(self):
+        """Release resources held by the hook (files, connections)."""
+        pass
 
 
 class HookManager:
-    """Manager for executing hooks after transcription."""
+    """Manager for executing hooks after transcription.
     
-    def __init__(self):
+    ``filters`` skips every hook for results with less than
+    ``min_text_length`` characters (default 1) or below ``min_confidence``
+    (default 0.0), so silence and noise never reach subprocesses or the network.
+    """
+    
+    def __init__(self, filters: Optional[Dict[str, Any]] = None):
         self.hooks: List[Hook] = []
+        # Enabled hooks, resolved on first dispatch; hooks don't change mid-stream
+        self._enabled_hooks: Optional[Tuple[Hook, ...]] = None
+        self.filters = filters or {}
+        self.min_text_length = self.filters.get('min_text_length', 1)
+        self.min_confidence = self.filters.get('min_confidence', 0.0)
         self.logger = get_logger()
         self.session_start_time = time.time()
         self.chunk_index = 0
+        # Created on first use, once all hooks are registered
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[queue.Queue] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._drop_when_full = False
+        self.dropped_results = 0
     
     def register_hook(self, hook: Hook):
         """Register a hook to be executed."""
         self.hooks.append(hook)
-        self.logger.info(f"Registered hook: {hook.name}")
+        self._enabled_hooks = None
+        self.logger.info("Registered hook: %s", hook.name)
+    
+    def refresh_enabled(self):
+        """Re-read which hooks are enabled after changing their config."""
+        self._enabled_hooks = None
+    
+    def _run_hook(self, hook: Hook, context: HookContext) -> HookResult:
+        """Run a single hook, logging and capturing its outcome."""
+        try:
+            start_time = time.time()
+            result = hook.execute(context)
+            execution_time = time.time() - start_time
+            
+            if result.success:
+                self.logger.debug("Hook '%s' executed successfully in %.3fs", hook.name, execution_time)
+                if result.message:
+                    self.logger.info("Hook '%s': %s", hook.name, result.message)
+            else:
+                self.logger.warning("Hook '%s' failed: %s", hook.name, result.error)
+            
+            return result
+            
+        except Exception as e:
+            self.logger.error("Hook '%s' raised exception: %s", hook.name, e)
+            return HookResult(
+                success=False,
+                error=f"Hook '{hook.name}' raised exception: {str(e)}"
+            )
+    
+    def passes_filters(self, text: str, confidence: float) -> bool:
+        """Check whether stripped transcription text is worth running hooks for."""
+        return len(text) >= self.min_text_length and confidence >= self.min_confidence
     
     def execute_hooks(self, context: HookContext) -> List[HookResult]:
-        """Execute all registered hooks."""
-        results = []
+        """Execute all registered hooks.
         
-        for hook in self.hooks:
-            if not hook.is_enabled():
-                continue
-            
+        Hooks are I/O bound (HTTP, subprocesses, files), so when more than one
+        is enabled they run concurrently and a chunk costs as much as its
+        slowest hook rather than the sum of all of them. Results keep the
+        registration order.
+        """
+        if not self.passes_filters(context.text, context.transcription_result.confidence):
+            return []
+        
+        if self._enabled_hooks is None:
+            self._enabled_hooks = tuple(hook for hook in self.hooks if hook.is_enabled())
+        enabled_hooks = [hook for hook in self._enabled_hooks if hook.should_run(context)]
+        if len(enabled_hooks) <= 1:
+            return [self._run_hook(hook, context) for hook in enabled_hooks]
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.hooks) or 4,
+                thread_name_prefix="hook"
+            )
+        
+        start_time = time.time()
+        futures = [
+            (hook, self._executor.submit(self._run_hook, hook, context))
+            for hook in enabled_hooks
+        ]
+        
+        results = []
+        for hook, future in futures:
+            timeout = hook.config.get('timeout', DEFAULT_HOOK_TIMEOUT)
+            remaining = max(0.0, start_time + timeout - time.time())
             try:
-                start_time = time.time()
-                result = hook.execute(context)
-                execution_time = time.time() - start_time
-                
-                if result.success:
-                    self.logger.debug(f"Hook '{hook.name}' executed successfully in {execution_time:.3f}s")
-                    if result.message:
-                        self.logger.info(f"Hook '{hook.name}': {result.message}")
-                else:
-                    self.logger.warning(f"Hook '{hook.name}' failed: {result.error}")
-                
-                results.append(result)
-                
-            except Exception as e:
-                error_result = HookResult(
+                results.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                self.logger.warning("Hook '%s' timed out after %ss", hook.name, timeout)
+                results.append(HookResult(
                     success=False,
-                    error=f"Hook '{hook.name}' raised exception: {str(e)}"
-                )
-                results.append(error_result)
-                self.logger.error(f"Hook '{hook.name}' raised exception: {e}")
+                    error=f"Hook '{hook.name}' timed out"
+                ))
         
         return results
     
-    def create_context(self, transcription_result, metadata: Optional[Dict[str, Any]] = None) -> HookContext:
+    def create_context(self, transcription_result, metadata: Optional[Dict[str, Any]] = None,
+                       text: Optional[str] = None) -> HookContext:
         """Create a hook context from transcription result."""
         context = HookContext(
             transcription_result=transcription_result,
             session_start_time=self.session_start_time,
             chunk_index=self.chunk_index,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            text=transcription_result.text.strip() if text is None else text
         )
         self.chunk_index += 1
-        return context
\ No newline at end of file
+        return context
+    
+    def start_dispatcher(self, max_pending: int = 8, drop_when_full: bool = False):
+        """Run hooks on a background thread fed by a bounded queue.
+        
+        Once started, submit() returns as soon as the context is queued, so
+        the transcription loop never waits on hook I/O. When max_pending
+        results are waiting, submit() blocks until the dispatcher catches up,
+        or with drop_when_full skips hooks for the new result instead.
+        """
+        if self._dispatch_thread is not None:
+            return
+        
+        self._drop_when_full = drop_when_full
+        self._pending = queue.Queue(maxsize=max(1, max_pending))
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop,
+            name="hook-dispatch",
+            daemon=True
+        )
+        self._dispatch_thread.start()
+    
+    def _dispatch_loop(self):
+        """Execute queued hook contexts until told to stop."""
+        while True:
+            context = self._pending.get()
+            if context is _STOP:
+                break
+            try:
+                self.execute_hooks(context)
+            except Exception as e:
+                self.logger.error("Hook dispatch failed: %s", e)
+    
+    def submit(self, transcription_result, metadata: Optional[Dict[str, Any]] = None):
+        """Run hooks for a transcription result, in the background if started."""
+        text = transcription_result.text.strip()
+        if not self.passes_filters(text, transcription_result.confidence):
+            return
+        
+        context = self.create_context(transcription_result, metadata, text)
+        if self._dispatch_thread is None:
+            self.execute_hooks(context)
+        elif self._drop_when_full:
+            try:
+                self._pending.put_nowait(context)
+            except queue.Full:
+                self.dropped_results += 1
+                self.logger.warning("Hooks falling behind, skipped chunk %d", context.chunk_index)
+        else:
+            self._pending.put(context)
+    
+    def stop_dispatcher(self, timeout: Optional[float] = 5.0):
+        """Let queued hooks finish for up to timeout seconds (None waits for all), then stop."""
+        if self._dispatch_thread is None:
+            return
+        
+        try:
+            self._pending.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Hook queue still full at shutdown, pending hooks dropped")
+        self._dispatch_thread.join(timeout=timeout)
+        self._dispatch_thread = None
+        self._pending = None
+    
+    def shutdown(self):
+        """Stop the dispatcher and hook worker threads."""
+        self.stop_dispatcher()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        
+        for hook in self.hooks:
+            try:
+                hook.close()
+            except Exception as e:
+                self.logger.warning("Failed to close hook '%s': %s", hook.name, e)
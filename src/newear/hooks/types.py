@@ -1,20 +1,30 @@
 """Types for hook system."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from newear.transcription.whisper_local import TranscriptionResult
 
+# One of each is created per chunk per hook; slots drop the per-instance
+# __dict__ and speed up attribute reads where the runtime supports them
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class HookContext:
     """Context information passed to hooks."""
     transcription_result: TranscriptionResult
     session_start_time: float
     chunk_index: int
     metadata: Dict[str, Any]
+    text: Optional[str] = None  # Stripped transcription text, shared by all hooks
+    
+    def __post_init__(self):
+        if self.text is None:
+            self.text = self.transcription_result.text.strip()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HookResult:
     """Result returned from a hook."""
     success: bool
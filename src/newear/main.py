@@ -3,26 +3,21 @@
 Newear CLI: Real-time system audio captioning tool
 """
 
+import logging
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from newear.audio.capture import AudioCapture
-from newear.audio.devices import AudioDevices
-from newear.output.file_writer import FileWriter
-from newear.output.display import RichTerminalDisplay, DisplayConfig
 from newear.utils.config import Config
 from newear.utils.config_file import ConfigManager
 from newear.utils.logging import get_logger, setup_logging, get_error_handler
-from newear.transcription.whisper_local import WhisperTranscriber
-from newear.transcription.file_transcriber import FileTranscriber
-from newear.hooks.manager import HookManager
-from newear.hooks.factory import HookFactory
+
+__all__ = ["app", "cli"]
 
 app = typer.Typer(
     name="newear",
@@ -36,6 +31,9 @@ app.add_typer(config_app, name="config")
 
 console = Console()
 
+# Formats written from the collected entries once transcription ends
+_EXTRA_FORMATS = frozenset({"json", "srt", "vtt", "csv"})
+
 
 @app.callback(invoke_without_command=True)
 def main(
@@ -46,6 +44,10 @@ def main(
     timestamps: Optional[bool] = typer.Option(None, "--timestamps", "-t", help="Include timestamps in output"),
     show_confidence: Optional[bool] = typer.Option(None, "--confidence", help="Show confidence scores in console output"),
     language: Optional[str] = typer.Option(None, "--language", "-l", help="Language code (auto-detect if not specified)"),
+    compute_type: Optional[str] = typer.Option(None, "--compute-type", help="Compute type (auto, int8, int8_float16, float16, float32). auto picks int8_float16 on GPU and int8 on CPU: faster and less memory for negligible accuracy loss"),
+    initial_prompt: Optional[str] = typer.Option(None, "--initial-prompt", help="Text to prime the model with, e.g. names and domain vocabulary"),
+    cpu_threads: Optional[int] = typer.Option(None, "--cpu-threads", help="CPU inference threads (default: min(8, CPU count))"),
+    warmup: Optional[bool] = typer.Option(None, "--warmup/--no-warmup", help="Warm up the model after loading so the first chunk isn't delayed"),
     sample_rate: Optional[int] = typer.Option(None, "--sample-rate", "-s", help="Audio sample rate in Hz"),
     chunk_duration: Optional[float] = typer.Option(None, "--chunk-duration", "-c", help="Audio chunk duration in seconds (3-10s recommended for better accuracy)"),
     list_devices: bool = typer.Option(False, "--list-devices", help="List available audio devices and exit"),
@@ -70,7 +72,8 @@ def main(
         config_manager.merge_with_cli_args(
             device=device, model=model, timestamps=timestamps,
             show_confidence=show_confidence, language=language,
-            sample_rate=sample_rate, chunk_duration=chunk_duration
+            compute_type=compute_type, cpu_threads=cpu_threads, warmup=warmup,
+            initial_prompt=initial_prompt, sample_rate=sample_rate, chunk_duration=chunk_duration
         )
         
         # Override rich_ui setting only if explicitly provided
@@ -96,6 +99,7 @@ def main(
     
     # List devices if requested
     if list_devices:
+        from newear.audio.devices import AudioDevices
         devices = AudioDevices()
         devices.list_devices()
         return
@@ -103,13 +107,20 @@ def main(
     # List models if requested
     if list_models:
         from newear.transcription.models import ModelManager
-        model_manager = ModelManager(custom_models=config_manager.config.models.models)
+        model_manager = ModelManager(custom_models=config_manager.config.models.models, console=console)
         model_manager.print_model_info()
         return
     
+    # Imported only when transcribing so --help, --list-* and the config
+    # commands don't load the audio stack, numpy and the display
+    from newear.audio.capture import AudioCapture
+    from newear.output.file_writer import FileWriter
+    from newear.output.display import RichTerminalDisplay, DisplayConfig
+    from newear.hooks.manager import HookManager
+    
     # Set default output file if not specified
     if output is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         output = Path(f"newear-{timestamp}.txt")
         if not config_manager.config.display.rich_ui:
             console.print(f"[blue]No output file specified, using: {output}[/blue]")
@@ -141,11 +152,12 @@ def main(
         sys.exit(1)
     
     # Initialize file writer
-    file_writer = FileWriter(output, config_manager.config.output.show_timestamps)
-    
-    # Initialize continuous file writer for one-liner output
+    # Initialize file writer, which also keeps the one-liner continuous file
     continuous_file = output.with_suffix('.continuous.txt')
-    continuous_writer = FileWriter(continuous_file, show_timestamps=False)
+    # Live sessions can run for hours, so entries for the extra export
+    # formats are spilled to a temporary file rather than kept in memory
+    file_writer = FileWriter(output, config_manager.config.output.show_timestamps,
+                             continuous_file=continuous_file, keep_in_memory=False)
     
     # Initialize rich terminal display
     display = None
@@ -155,33 +167,62 @@ def main(
             show_timestamps=config_manager.config.output.show_timestamps,
             show_confidence=config_manager.config.output.show_confidence,
             show_stats=config_manager.config.display.show_stats,
-            update_interval=config_manager.config.display.update_interval
+            update_interval=config_manager.config.display.update_interval,
+            full_screen=config_manager.config.display.full_screen
         )
         display = RichTerminalDisplay(display_config)
     
     # Initialize hook manager
-    hook_manager = HookManager()
-    if config_manager.config.hooks.enabled:
+    hook_manager = HookManager(filters=config_manager.config.hooks.filters)
+    if config_manager.config.hooks.has_any_hooks():
+        from newear.hooks.factory import HookFactory
         hooks = HookFactory.create_hooks_from_config(config_manager.config.hooks.to_dict())
         for hook in hooks:
             hook_manager.register_hook(hook)
         if hooks:
             logger.info(f"Initialized {len(hooks)} hooks")
-    else:
+            # Run hooks off the transcription loop; once roughly 16 seconds
+            # of results are waiting, skip hooks rather than stall captions
+            hook_manager.start_dispatcher(
+                max_pending=int(16 / config_manager.config.audio.chunk_duration),
+                drop_when_full=True
+            )
+    elif not config_manager.config.hooks.enabled:
         logger.info("Hooks disabled in configuration")
+    else:
+        logger.info("Hooks enabled but none configured")
     
     # Initialize transcriber
     try:
+        from newear.transcription.whisper_local import WhisperTranscriber
         transcriber = WhisperTranscriber(
             model_size=config_manager.config.transcription.model_size,
             language=config_manager.config.transcription.language,
             device=config_manager.config.transcription.device,
             compute_type=config_manager.config.transcription.compute_type,
-            custom_models=config_manager.config.models.models
+            custom_models=config_manager.config.models.models,
+            warmup=config_manager.config.transcription.warmup,
+            cpu_threads=config_manager.config.transcription.cpu_threads,
+            num_workers=config_manager.config.transcription.num_workers,
+            initial_prompt=config_manager.config.transcription.initial_prompt
         )
         if not config_manager.config.display.rich_ui:
             console.print(f"[blue]Initializing Whisper model: {config_manager.config.transcription.model_size}[/blue]")
         logger.info(f"Initializing Whisper model: {config_manager.config.transcription.model_size}")
+        
+        # Load the model on a daemon thread while the display, output files
+        # and audio capture are set up; transcription waits for it below.
+        # Being a daemon, an unfinished load or download never holds up exit
+        model_loaded = threading.Event()
+        model_status = {}
+        
+        def _load_model():
+            try:
+                model_status['ok'] = transcriber.load_model()
+            finally:
+                model_loaded.set()
+        
+        threading.Thread(target=_load_model, name="model-loader", daemon=True).start()
     except Exception as e:
         error_handler.handle_error(e, "initializing transcriber", fatal=True)
         sys.exit(1)
@@ -195,7 +236,7 @@ def main(
         console.print(f"[blue]Chunk duration: {config_manager.config.audio.chunk_duration}s[/blue]")
         console.print(f"[blue]Language: {config_manager.config.transcription.language or 'auto-detect'}[/blue]")
         console.print(f"[blue]Output file: {output}[/blue]")
-        console.print(f"[blue]Continuous file: {output.with_suffix('.continuous.txt')}[/blue]")
+        console.print(f"[blue]Continuous file: {continuous_file}[/blue]")
         console.print(f"[blue]Output formats: {', '.join(output_formats)}[/blue]")
         console.print("[yellow]Press Ctrl+C to stop[/yellow]")
         console.print("-" * 50)
@@ -210,6 +251,7 @@ def main(
             config_manager.config.audio.chunk_duration
         )
         display.set_status("Initializing...")
+        display.set_model_loading(True)
         display.start()
     
     # Log system and configuration info
@@ -222,12 +264,21 @@ def main(
     try:
         # Open files for writing (always enabled now)
         file_writer.open_file()
-        continuous_writer.open_file()
+        # Keep disk latency off the transcription loop
+        file_writer.start_writer()
             
         # Start audio capture
         if not audio_capture.start_capture():
             console.print("[red]Failed to start audio capture[/red]")
             sys.exit(1)
+        
+        # Wait for the background model load, in short steps so Ctrl+C
+        # is handled promptly
+        while not model_loaded.wait(0.1):
+            pass
+        if not model_status.get('ok'):
+            console.print("[red]Failed to load Whisper model[/red]")
+            sys.exit(1)
             
         # Start real-time transcription
         if not config_manager.config.display.rich_ui:
@@ -240,40 +291,41 @@ def main(
         
         logger.info("Starting real-time transcription")
         
+        # Settings read per chunk, bound once for the loop
+        run_hooks = config_manager.config.hooks.enabled and bool(hook_manager.hooks)
+        write_entry = file_writer.write_entry
+        debug_on = logger.isEnabledFor(logging.DEBUG)
+        
         # Use the transcriber's streaming method for real-time processing
         for result in transcriber.transcribe_chunk_stream(
             audio_capture.get_audio_chunks(),
             sample_rate=config_manager.config.audio.sample_rate
         ):
-            if result and result.text.strip():
-                text = result.text.strip()
+            text = result.text.strip() if result else ""
+            if text:
                 
                 # Add to rich display
                 if display:
                     display.add_transcription(result)
                     display.update()
                 
-                # Write to timestamped file (always enabled now)
+                # Write to the timestamped and continuous files (always enabled now)
                 try:
-                    file_writer.write_entry(text, confidence=result.confidence)
-                    continuous_writer.write_continuous(text)
+                    write_entry(text, confidence=result.confidence)
                 except Exception as e:
                     error_handler.handle_error(e, "writing to file")
                 
                 # Execute hooks after processing
-                if config_manager.config.hooks.enabled:
+                if run_hooks:
                     try:
-                        hook_context = hook_manager.create_context(result)
-                        hook_results = hook_manager.execute_hooks(hook_context)
-                        # Log any hook failures
-                        for hook_result in hook_results:
-                            if not hook_result.success:
-                                logger.warning(f"Hook failed: {hook_result.error}")
+                        # Failures are logged by the hook manager
+                        hook_manager.submit(result)
                     except Exception as e:
                         error_handler.handle_error(e, "executing hooks")
                 
                 # Log transcription
-                logger.debug(f"Transcribed: {text} (confidence: {result.confidence:.2f})")
+                if debug_on:
+                    logger.debug("Transcribed: %s (confidence: %.2f)", text, result.confidence)
         
     except KeyboardInterrupt:
         logger.info("Transcription stopped by user")
@@ -284,61 +336,57 @@ def main(
         if display:
             display.set_transcribing(False)
             display.set_status("Stopping...")
-            display.stop()
-        
-        # Cleanup
-        audio_capture.stop()
-        transcriber.cleanup()
-        file_writer.close_file()
-        continuous_writer.close_file()
-        
-        # Write additional formats
-        if "json" in output_formats or "srt" in output_formats or "vtt" in output_formats or "csv" in output_formats:
-            try:
-                file_writer.write_all_formats(output, output_formats)
-                logger.info(f"Additional formats written: {output_formats}")
-            except Exception as e:
-                error_handler.handle_error(e, "writing additional formats")
-        
-        # Show statistics
-        stats = file_writer.get_stats()
-        if not config_manager.config.display.rich_ui:
-            console.print(f"[green]Written {stats['total_entries']} entries to {output}[/green]")
-            console.print(f"[green]Continuous transcript saved to {output.with_suffix('.continuous.txt')}[/green]")
-        
-        # Show performance stats
-        perf_stats = transcriber.get_performance_stats()
-        if perf_stats['total_transcriptions'] > 0:
-            if not config_manager.config.display.rich_ui:
-                console.print(f"[blue]Transcribed {perf_stats['total_transcriptions']} chunks[/blue]")
-                console.print(f"[blue]Average transcription time: {perf_stats['avg_transcription_time']:.2f}s[/blue]")
-            logger.info(f"Transcription performance: {perf_stats}")
-        
-        # Show rich display summary
-        if display:
-            display.print_summary()
-        
-        # Log final stats
-        logger.info("=== Session Complete ===")
-        logger.info(f"Total entries: {stats['total_entries']}")
-        logger.info(f"Total transcriptions: {perf_stats.get('total_transcriptions', 0)}")
-        
-        if not config_manager.config.display.rich_ui:
-            console.print("[green]Goodbye![/green]")
         
     except Exception as e:
         error_handler.handle_error(e, "during transcription", fatal=True)
+        sys.exit(1)
         
-        # Cleanup
-        audio_capture.stop()
-        transcriber.cleanup()
-        file_writer.close_file()
-        continuous_writer.close_file()
-        
+    finally:
+        # Cleanup on every exit path
         if display:
             display.stop()
-        
-        sys.exit(1)
+        audio_capture.stop()
+        # A load still in progress would set the model after cleanup
+        if model_loaded.is_set():
+            transcriber.cleanup()
+        hook_manager.shutdown()
+        file_writer.close_file()
+    
+    # Write additional formats
+    extra_formats = [f for f in output_formats if f in _EXTRA_FORMATS]
+    if extra_formats:
+        try:
+            file_writer.write_all_formats(output, extra_formats)
+            logger.info(f"Additional formats written: {extra_formats}")
+        except Exception as e:
+            error_handler.handle_error(e, "writing additional formats")
+    
+    # Show statistics
+    rich_ui = config_manager.config.display.rich_ui
+    stats = file_writer.get_stats()
+    if not rich_ui:
+        console.print(f"[green]Written {stats['total_entries']} entries to {output}[/green]")
+        console.print(f"[green]Continuous transcript saved to {continuous_file}[/green]")
+    
+    # Show performance stats
+    perf_stats = transcriber.get_performance_stats()
+    if perf_stats['total_transcriptions'] > 0:
+        if not rich_ui:
+            console.print(f"[blue]Transcribed {perf_stats['total_transcriptions']} chunks[/blue]")
+            console.print(f"[blue]Average transcription time: {perf_stats['avg_transcription_time']:.2f}s[/blue]")
+        logger.info(f"Transcription performance: {perf_stats}")
+    
+    # Show rich display summary
+    if display:
+        display.print_summary()
+    
+    # Log final stats
+    logger.info("=== Session Complete ===")
+    logger.info(f"Total entries: {stats['total_entries']}")
+    logger.info(f"Total transcriptions: {perf_stats.get('total_transcriptions', 0)}")
+    
+    if not rich_ui:
+        console.print("[green]Goodbye![/green]")
 
 
 @config_app.command("show")
@@ -362,6 +410,24 @@ def create_config(
         console.print("[red]Failed to create configuration[/red]")
 
 
+@config_app.command("clear-cache")
+def clear_cache(
+    config_file: Optional[Path] = typer.Option(None, "--config", help="Path to configuration file"),
+):
+    """Delete translations cached by the OpenAI translation hook."""
+    from newear.hooks.builtin import clear_translation_cache, translation_cache_paths
+    config_manager = ConfigManager()
+    config_manager.load_config(config_file)
+    
+    cleared = False
+    for path in translation_cache_paths(config_manager.config.hooks.hooks):
+        if clear_translation_cache(path):
+            console.print(f"[green]Cleared translation cache: {path}[/green]")
+            cleared = True
+    if not cleared:
+        console.print("[yellow]No translation cache to clear[/yellow]")
+
+
 @config_app.command("template")
 def show_template():
     """Show configuration template."""
@@ -377,6 +443,10 @@ def transcribe_file(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Whisper model size/name or path (tiny, base, small, medium, large, custom name, or file path)"),
     language: Optional[str] = typer.Option(None, "--language", "-l", help="Language code (auto-detect if not specified)"),
     formats: Optional[str] = typer.Option(None, "--formats", help="Output formats (comma-separated: txt,json,srt,vtt,csv)"),
+    compute_type: Optional[str] = typer.Option(None, "--compute-type", help="Compute type (auto, int8, int8_float16, float16, float32). auto picks int8_float16 on GPU and int8 on CPU"),
+    cpu_threads: Optional[int] = typer.Option(None, "--cpu-threads", help="CPU inference threads (default: min(8, CPU count))"),
+    num_workers: Optional[int] = typer.Option(None, "--num-workers", help="Model workers; >1 transcribes VAD-cut chunks of the file in parallel"),
+    batch_size: Optional[int] = typer.Option(None, "--batch-size", help="Transcribe in batches of this many segments (0 = off)"),
     config_file: Optional[Path] = typer.Option(None, "--config", help="Path to configuration file"),
     log_level: str = typer.Option("INFO", "--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
 ):
@@ -392,6 +462,14 @@ def transcribe_file(
             config_manager.config.transcription.model_size = model
         if language is not None:
             config_manager.config.transcription.language = language
+        if compute_type is not None:
+            config_manager.config.transcription.compute_type = compute_type
+        if cpu_threads is not None:
+            config_manager.config.transcription.cpu_threads = cpu_threads
+        if num_workers is not None:
+            config_manager.config.transcription.num_workers = num_workers
+        if batch_size is not None:
+            config_manager.config.transcription.batch_size = batch_size
         
         # Setup logging
         setup_logging(level=log_level, enable_rich=True)
@@ -423,12 +501,19 @@ def transcribe_file(
         logger.info(f"Output formats: {output_formats}")
     
     # Initialize file transcriber
+    from newear.transcription.file_transcriber import FileTranscriber
+    from newear.output.file_writer import FileWriter
+    from newear.hooks.manager import HookManager
     file_transcriber = FileTranscriber(
         model_size=config_manager.config.transcription.model_size,
         language=config_manager.config.transcription.language,
         device=config_manager.config.transcription.device,
         compute_type=config_manager.config.transcription.compute_type,
-        custom_models=config_manager.config.models.models
+        custom_models=config_manager.config.models.models,
+        cpu_threads=config_manager.config.transcription.cpu_threads,
+        num_workers=config_manager.config.transcription.num_workers,
+        batch_size=config_manager.config.transcription.batch_size,
+        initial_prompt=config_manager.config.transcription.initial_prompt
     )
     
     # Show supported formats if unsupported file
@@ -437,23 +522,24 @@ def transcribe_file(
     except Exception:
         supported_formats = []
     
-    # Initialize file writers
-    file_writer = FileWriter(output, show_timestamps=True)
-    continuous_writer = FileWriter(output.with_suffix('.continuous.txt'), show_timestamps=False)
+    # Initialize file writer with the one-liner continuous file alongside
+    continuous_file = output.with_suffix('.continuous.txt')
+    file_writer = FileWriter(output, show_timestamps=True, continuous_file=continuous_file)
     
     # Initialize hook manager for file transcription
-    hook_manager = HookManager()
-    if config_manager.config.hooks.enabled:
+    hook_manager = HookManager(filters=config_manager.config.hooks.filters)
+    if config_manager.config.hooks.has_any_hooks():
+        from newear.hooks.factory import HookFactory
         hooks = HookFactory.create_hooks_from_config(config_manager.config.hooks.to_dict())
         for hook in hooks:
             hook_manager.register_hook(hook)
         if hooks:
             logger.info(f"Initialized {len(hooks)} hooks for file transcription")
+            hook_manager.start_dispatcher()
     
     try:
         # Open files for writing
         file_writer.open_file()
-        continuous_writer.open_file()
         
         console.print(f"[green]Starting transcription of: {file_path.name}[/green]")
         console.print(f"[blue]Using model: {config_manager.config.transcription.model_size}[/blue]")
@@ -462,46 +548,48 @@ def transcribe_file(
         
         # Process the file
         total_entries = 0
+        run_hooks = config_manager.config.hooks.enabled and bool(hook_manager.hooks)
+        debug_on = logger.isEnabledFor(logging.DEBUG)
         for result in file_transcriber.transcribe_file(file_path):
-            if result and result.text.strip():
-                text = result.text.strip()
+            text = result.text.strip() if result else ""
+            if text:
                 
                 # Write to files
                 file_writer.write_entry(text, confidence=result.confidence, 
                                       start_time=result.start_time, end_time=result.end_time)
-                continuous_writer.write_continuous(text)
                 
                 # Execute hooks after processing
-                if config_manager.config.hooks.enabled:
+                if run_hooks:
                     try:
-                        hook_context = hook_manager.create_context(result)
-                        hook_results = hook_manager.execute_hooks(hook_context)
-                        # Log any hook failures
-                        for hook_result in hook_results:
-                            if not hook_result.success:
-                                logger.warning(f"Hook failed: {hook_result.error}")
+                        # Failures are logged by the hook manager
+                        hook_manager.submit(result)
                     except Exception as e:
                         error_handler.handle_error(e, "executing hooks")
                 
                 total_entries += 1
                 
                 # Log progress
-                logger.debug(f"Transcribed segment: {text[:50]}... (confidence: {result.confidence:.2f})")
+                if debug_on:
+                    logger.debug("Transcribed segment: %.50s... (confidence: %.2f)", text, result.confidence)
+        
+        # Let hooks for the last segments finish before reporting completion
+        hook_manager.stop_dispatcher(timeout=None)
         
         console.print(f"[green]Transcription completed! {total_entries} segments processed.[/green]")
         
         # Write additional formats
-        if "json" in output_formats or "srt" in output_formats or "vtt" in output_formats or "csv" in output_formats:
+        extra_formats = [f for f in output_formats if f in _EXTRA_FORMATS]
+        if extra_formats:
             try:
-                file_writer.write_all_formats(output, output_formats)
-                console.print(f"[green]Additional formats written: {output_formats}[/green]")
+                file_writer.write_all_formats(output, extra_formats)
+                console.print(f"[green]Additional formats written: {extra_formats}[/green]")
             except Exception as e:
                 error_handler.handle_error(e, "writing additional formats")
         
         # Show statistics
         stats = file_writer.get_stats()
         console.print(f"[green]Output file: {output}[/green]")
-        console.print(f"[green]Continuous file: {output.with_suffix('.continuous.txt')}[/green]")
+        console.print(f"[green]Continuous file: {continuous_file}[/green]")
         console.print(f"[blue]Total entries: {stats['total_entries']}[/blue]")
         console.print(f"[blue]Total text length: {stats['total_text_length']} characters[/blue]")
         
@@ -522,7 +610,7 @@ def transcribe_file(
     finally:
         # Clean up
         file_writer.close_file()
-        continuous_writer.close_file()
+        hook_manager.shutdown()
         file_transcriber.cleanup()
 
 
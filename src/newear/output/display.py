@@ -2,7 +2,6 @@
 
 import threading
 import time
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from collections import deque
@@ -12,10 +11,8 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from rich.align import Align
 from rich.layout import Layout
-from rich.status import Status
 
 from newear.transcription.whisper_local import TranscriptionResult
 
@@ -27,22 +24,31 @@ class DisplayConfig:
     show_timestamps: bool = True
     show_confidence: bool = False
     show_stats: bool = True
-    update_interval: float = 0.1
+    update_interval: float = 1.0  # Idle redraw period; changes redraw immediately
+    full_screen: bool = True  # Alternate screen buffer; False draws inline below the prompt
     confidence_threshold: float = 0.7
 
 
 class RichTerminalDisplay:
     """Rich terminal display for real-time transcription."""
     
+    # Shortest time between redraws; changes inside it are drawn together
+    _MIN_REFRESH_GAP = 0.05
+    
     def __init__(self, config: DisplayConfig = None):
         """Initialize the display."""
         self.config = config or DisplayConfig()
         self.console = Console()
         self.live = None
         self.is_running = False
+        # Redraws are driven by state changes rather than a fixed frame rate
+        self._refresh_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
         
         # Thread-safe storage for transcription results
         self.transcription_buffer = deque(maxlen=self.config.max_lines)
+        # Transcript table cells, built once when each result arrives
+        self._rows = deque(maxlen=self.config.max_lines)
         self.stats = {
             'total_chunks': 0,
             'high_confidence_chunks': 0,
@@ -58,6 +64,17 @@ class RichTerminalDisplay:
         self.is_transcribing = False
         self.model_loading = False
         
+        # Rendered layout, kept between refreshes; only panels named in
+        # _stale are rebuilt, plus the stats panel when its runtime ticks over
+        self._layout: Optional[Layout] = None
+        self._stale = {'header', 'transcript', 'stats'}
+        self._runtime_shown: Optional[int] = None
+        
+    def _mark_stale(self, *panels: str):
+        """Flag panels for rebuilding and wake the refresher; call with the lock held."""
+        self._stale.update(panels)
+        self._refresh_event.set()
+    
     def set_model_info(self, model_size: str, language: str = None):
         """Set model information for display."""
         with self.lock:
@@ -65,6 +82,7 @@ class RichTerminalDisplay:
                 'size': model_size,
                 'language': language or 'auto-detect'
             }
+            self._mark_stale('header')
     
     def set_device_info(self, device_name: str, sample_rate: int, chunk_duration: float):
         """Set audio device information."""
@@ -74,33 +92,63 @@ class RichTerminalDisplay:
                 'sample_rate': sample_rate,
                 'chunk_duration': chunk_duration
             }
+            self._mark_stale('header')
     
     def set_status(self, status: str):
         """Update the current status."""
         with self.lock:
             self.current_status = status
+            self._mark_stale('header')
     
     def set_model_loading(self, loading: bool):
         """Set model loading state."""
         with self.lock:
             self.model_loading = loading
+            self._mark_stale('header')
     
     def set_transcribing(self, transcribing: bool):
         """Set transcription state."""
         with self.lock:
             self.is_transcribing = transcribing
             if transcribing and self.stats['start_time'] is None:
-                self.stats['start_time'] = time.time()
+                # Monotonic, only ever used for the runtime
+                self.stats['start_time'] = time.monotonic()
+            self._mark_stale('header', 'stats')
     
     def add_transcription(self, result: TranscriptionResult):
         """Add a transcription result to the display."""
         with self.lock:
             self.transcription_buffer.append(result)
+            self._rows.append(self._build_row(result))
             self.stats['total_chunks'] += 1
             self.stats['last_update'] = time.time()
             
             if result.confidence > self.config.confidence_threshold:
                 self.stats['high_confidence_chunks'] += 1
+            self._mark_stale('transcript', 'stats')
+    
+    def _build_row(self, result: TranscriptionResult) -> tuple:
+        """Build the transcript table cells for a result."""
+        row = []
+        
+        # Timestamp
+        if self.config.show_timestamps:
+            row.append(time.strftime("%H:%M:%S", time.localtime(result.start_time or time.time())))
+        
+        # Text and confidence share a confidence-based style
+        if result.confidence > 0.8:
+            style = "green"
+        elif result.confidence > 0.5:
+            style = "yellow"
+        else:
+            style = "red"
+        
+        row.append(Text(result.text, style=style))
+        
+        if self.config.show_confidence:
+            row.append(Text(f"{result.confidence:.2f}", style=style))
+        
+        return tuple(row)
     
     def _create_header_panel(self) -> Panel:
         """Create the header panel with model and device info."""
@@ -149,35 +197,7 @@ class RichTerminalDisplay:
             table.add_column(justify="right", width=6)
         
         # Add recent transcriptions
-        for result in self.transcription_buffer:
-            row = []
-            
-            # Timestamp
-            if self.config.show_timestamps:
-                timestamp = datetime.fromtimestamp(result.start_time or time.time())
-                row.append(timestamp.strftime("%H:%M:%S"))
-            
-            # Text with confidence-based styling
-            if result.confidence > 0.8:
-                text_style = "green"
-            elif result.confidence > 0.5:
-                text_style = "yellow"
-            else:
-                text_style = "red"
-            
-            row.append(Text(result.text, style=text_style))
-            
-            # Confidence
-            if self.config.show_confidence:
-                conf_text = f"{result.confidence:.2f}"
-                if result.confidence > 0.8:
-                    conf_style = "green"
-                elif result.confidence > 0.5:
-                    conf_style = "yellow"
-                else:
-                    conf_style = "red"
-                row.append(Text(conf_text, style=conf_style))
-            
+        for row in self._rows:
             table.add_row(*row)
         
         return Panel(table, title="Transcript", title_align="left", border_style="green")
@@ -198,7 +218,7 @@ class RichTerminalDisplay:
         
         # Runtime
         if self.stats['start_time']:
-            runtime = time.time() - self.stats['start_time']
+            runtime = time.monotonic() - self.stats['start_time']
             runtime_text = f"Runtime: {runtime:.0f}s"
         else:
             runtime_text = "Runtime: 0s"
@@ -239,16 +259,47 @@ class RichTerminalDisplay:
         
         return layout
     
+    def _render(self) -> Layout:
+        """Return the layout, rebuilding only the panels whose state changed."""
+        with self.lock:
+            runtime_shown = None
+            if self.config.show_stats and self.stats['start_time']:
+                runtime_shown = round(time.monotonic() - self.stats['start_time'])
+            
+            if self._layout is None:
+                self._layout = self._create_layout()
+            else:
+                stale = self._stale
+                if 'header' in stale:
+                    self._layout["header"].update(self._create_header_panel())
+                if 'transcript' in stale:
+                    target = "transcript" if self.config.show_stats else "body"
+                    self._layout[target].update(self._create_transcription_panel())
+                if self.config.show_stats and ('stats' in stale
+                                               or runtime_shown != self._runtime_shown):
+                    self._layout["stats"].update(self._create_stats_panel())
+            
+            self._stale.clear()
+            self._runtime_shown = runtime_shown
+            return self._layout
+    
     def start(self):
         """Start the live display."""
         if self.is_running:
             return
         
         self.is_running = True
-        self.live = Live(self._create_layout(), console=self.console, 
-                        refresh_per_second=1/self.config.update_interval,
-                        screen=True)
-        self.live.start()
+        self.live = Live(console=self.console,
+                         get_renderable=self._render,
+                         auto_refresh=False,
+                         screen=self.config.full_screen)
+        self.live.start(refresh=True)
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            name="display-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
     
     def stop(self):
         """Stop the live display."""
@@ -256,21 +307,51 @@ class RichTerminalDisplay:
             return
         
         self.is_running = False
+        if self._refresh_thread:
+            self._refresh_event.set()
+            self._refresh_thread.join()
+            self._refresh_thread = None
         if self.live:
             self.live.stop()
             self.live = None
     
     def update(self):
-        """Update the display (called automatically by Live)."""
-        if self.live and self.is_running:
-            self.live.update(self._create_layout())
+        """Ask for a redraw as soon as the refresher can batch it."""
+        self._refresh_event.set()
+    
+    def _needs_refresh(self) -> bool:
+        """Check whether any panel is stale or the shown runtime has ticked over."""
+        with self.lock:
+            if self._stale:
+                return True
+            if self.config.show_stats and self.stats['start_time']:
+                return round(time.monotonic() - self.stats['start_time']) != self._runtime_shown
+            return False
+    
+    def _refresh_loop(self):
+        """Redraw on state changes, waking at least once per update_interval.
+        
+        Changes arriving within _MIN_REFRESH_GAP of the last redraw are
+        coalesced into the next one, so a burst of results costs one frame.
+        """
+        wake = self._refresh_event
+        last_refresh = 0.0
+        while self.is_running:
+            wake.wait(self.config.update_interval)
+            delay = last_refresh + self._MIN_REFRESH_GAP - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            wake.clear()
+            if self.is_running and self._needs_refresh():
+                self.live.refresh()
+                last_refresh = time.monotonic()
     
     def print_summary(self):
         """Print a summary when stopping."""
         if not self.stats['start_time']:
             return
         
-        runtime = time.time() - self.stats['start_time']
+        runtime = time.monotonic() - self.stats['start_time']
         total_chunks = self.stats['total_chunks']
         high_conf_chunks = self.stats['high_confidence_chunks']
         
@@ -1,14 +1,41 @@
 """File output functionality for newear."""
 
 import json
+import queue
+import sys
+import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, TextIO, List, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, TextIO, List, Dict, Any, Iterator
+from dataclasses import dataclass
 
+try:
+    # Optional C serializer (pip install newear[fastjson])
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+__all__ = ["TranscriptEntry", "FileWriter"]
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Slotted entries are smaller, which adds up over long sessions (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TranscriptEntry:
     """Represents a single transcript entry."""
     timestamp: float
@@ -19,17 +46,45 @@ class TranscriptEntry:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # Built directly; asdict() deep-copies and walks the fields generically
+        return {
+            'timestamp': self.timestamp,
+            'text': self.text,
+            'confidence': self.confidence,
+            'start_time': self.start_time,
+            'end_time': self.end_time
+        }
 
 
 class FileWriter:
     """Handles file output for transcripts."""
     
-    def __init__(self, output_file: Optional[Path] = None, show_timestamps: bool = True):
+    def __init__(self, output_file: Optional[Path] = None, show_timestamps: bool = True,
+                 continuous_file: Optional[Path] = None, keep_in_memory: bool = True):
         self.output_file = output_file
         self.show_timestamps = show_timestamps
         self.file_handle: Optional[TextIO] = None
+        # Optional one-line transcript that write_entry() appends to as well
+        self.continuous_file = continuous_file
+        self.continuous_handle: Optional[TextIO] = None
         self.entries: List[TranscriptEntry] = []
+        # With keep_in_memory off, entries go to an unnamed temporary file
+        # instead and are read back only by the json/srt/vtt/csv exports
+        self.keep_in_memory = keep_in_memory
+        self._spill: Optional[TextIO] = None
+        # Running totals so get_stats() doesn't need the entries
+        self._entry_count = 0
+        self._total_text_length = 0
+        self._first_timestamp: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+        # Set by start_writer() to move file and console output off the caller
+        self._pending: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._flush_every = 8
+        self._flush_interval = 1.0
+        # Flush bookkeeping for writes made directly on the caller's thread
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
         
     def open_file(self) -> bool:
         """Open the output file for writing."""
@@ -38,16 +93,130 @@ class FileWriter:
             
         try:
             self.file_handle = open(self.output_file, 'w', encoding='utf-8')
+            if self.continuous_file:
+                self.continuous_handle = open(self.continuous_file, 'w', encoding='utf-8')
             return True
         except Exception as e:
             print(f"Error opening output file: {e}")
             return False
     
+    def start_writer(self, max_pending: int = 256, flush_every: int = 8,
+                     flush_interval: float = 1.0):
+        """Write from a background thread so a slow disk can't stall the caller.
+        
+        Entries are still recorded immediately; only file and console output is
+        queued. The file is flushed every flush_every entries, after
+        flush_interval seconds, or as soon as the queue runs dry.
+        close_file() drains the queue before closing.
+        """
+        if self._writer_thread is not None:
+            return
+        
+        self._flush_every = max(1, flush_every)
+        self._flush_interval = flush_interval
+        self._pending = queue.Queue(maxsize=max(1, max_pending))
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="transcript-writer",
+            daemon=True
+        )
+        self._writer_thread.start()
+    
+    def _writer_loop(self):
+        """Write queued output in batches until told to stop."""
+        pending = self._pending
+        unflushed = 0
+        last_flush = time.monotonic()
+        stopping = False
+        
+        while not stopping:
+            try:
+                item = pending.get(timeout=self._flush_interval if unflushed else None)
+            except queue.Empty:
+                item = ()
+            
+            # Take whatever else is already waiting so it goes out in one write
+            batch = []
+            while item is not None:
+                if item:
+                    batch.append(item)
+                if len(batch) >= self._flush_every:
+                    break
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+            stopping = item is None
+            
+            try:
+                if batch:
+                    self._write_batch(batch)
+                    unflushed += len(batch)
+                now = time.monotonic()
+                if unflushed and (stopping or pending.empty()
+                                  or unflushed >= self._flush_every
+                                  or now - last_flush >= self._flush_interval):
+                    self._flush()
+                    unflushed = 0
+                    last_flush = now
+            except Exception as e:
+                print(f"Error writing transcript: {e}")
+    
+    def _write_batch(self, batch: List[tuple]):
+        """Write several queued items with a single call per file, echoing as needed."""
+        if self.file_handle:
+            self.file_handle.writelines(data for data, _, _ in batch)
+        if self.continuous_handle:
+            self.continuous_handle.writelines(fragment for _, _, fragment in batch if fragment)
+        # One write for the whole batch; sys.stdout is looked up each time
+        # because the live display swaps it out while it runs
+        echoed = [data for data, echo, _ in batch if echo]
+        if echoed:
+            sys.stdout.write("".join(echoed))
+    
+    def _flush(self):
+        """Flush both output files."""
+        if self.file_handle:
+            self.file_handle.flush()
+        if self.continuous_handle:
+            self.continuous_handle.flush()
+    
+    def stop_writer(self):
+        """Finish queued writes and stop the background writer."""
+        if self._writer_thread is None:
+            return
+        
+        self._pending.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._pending = None
+    
+    def _emit(self, data: str, echo: bool, fragment: Optional[str] = None):
+        """Write now, or hand off to the background writer if it is running."""
+        if self._pending is not None:
+            self._pending.put((data, echo, fragment))
+            return
+        
+        # Same flush thresholds as the background writer; close_file()
+        # flushes whatever is left
+        self._write_batch(((data, echo, fragment),))
+        self._unflushed += 1
+        now = time.monotonic()
+        if (self._unflushed >= self._flush_every
+                or now - self._last_flush >= self._flush_interval):
+            self._flush()
+            self._unflushed = 0
+            self._last_flush = now
+    
     def close_file(self):
-        """Close the output file."""
+        """Close the output files."""
+        self.stop_writer()
         if self.file_handle:
             self.file_handle.close()
             self.file_handle = None
+        if self.continuous_handle:
+            self.continuous_handle.close()
+            self.continuous_handle = None
     
     def write_entry(self, text: str, confidence: Optional[float] = None, 
                    start_time: Optional[float] = None, end_time: Optional[float] = None):
@@ -61,7 +230,15 @@ class FileWriter:
             end_time=end_time
         )
         
-        self.entries.append(entry)
+        if self.keep_in_memory:
+            self.entries.append(entry)
+        else:
+            self._spill_entry(entry)
+        self._entry_count += 1
+        self._total_text_length += len(text)
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+        self._last_timestamp = timestamp
         
         # Format the entry for file output
         if self.show_timestamps:
@@ -70,26 +247,49 @@ class FileWriter:
         else:
             formatted_entry = f"{text}\n"
         
-        # Write to file if available
-        if self.file_handle:
-            self.file_handle.write(formatted_entry)
-            self.file_handle.flush()
+        # Write to file if available and always print to console; the
+        # continuous transcript gets the bare text in the same hand-off
+        fragment = f"{text} " if self.continuous_handle else None
+        self._emit(formatted_entry, echo=True, fragment=fragment)
+    
+    def _spill_entry(self, entry: TranscriptEntry):
+        """Append an entry to the temporary spill file as one JSON line."""
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self._spill.write(_dumps(entry.to_dict()))
+        self._spill.write("\n")
+    
+    def _iter_entries(self) -> Iterator[TranscriptEntry]:
+        """Yield every entry, from memory or from the spill file."""
+        if self._spill is None:
+            yield from self.entries
+            return
         
-        # Always print to console
-        print(formatted_entry.rstrip())
+        self._spill.flush()
+        self._spill.seek(0)
+        try:
+            for line in self._spill:
+                yield TranscriptEntry(**_loads(line))
+        finally:
+            self._spill.seek(0, 2)
     
     def write_continuous(self, text: str):
         """Write text to continuous file without line breaks."""
-        if self.file_handle:
-            # Write with space separator, no newline
-            self.file_handle.write(f"{text} ")
-            self.file_handle.flush()
+        # Write with space separator, no newline
+        self._emit(f"{text} ", echo=False)
     
     def write_json(self, output_file: Path):
         """Write transcript as JSON."""
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump([entry.to_dict() for entry in self.entries], f, indent=2)
+                # Stream one entry at a time rather than building the whole
+                # list first; the layout matches json.dump(..., indent=2)
+                separator = "[\n  "
+                for entry in self._iter_entries():
+                    f.write(separator)
+                    f.write(_dumps(entry.to_dict(), indent=True).replace("\n", "\n  "))
+                    separator = ",\n  "
+                f.write("[]" if separator == "[\n  " else "\n]")
             print(f"JSON transcript saved to: {output_file}")
         except Exception as e:
             print(f"Error writing JSON: {e}")
@@ -98,7 +298,7 @@ class FileWriter:
         """Write transcript as SRT subtitles."""
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                for i, entry in enumerate(self.entries, 1):
+                for i, entry in enumerate(self._iter_entries(), 1):
                     if entry.start_time is not None and entry.end_time is not None:
                         start = self._format_srt_time(entry.start_time)
                         end = self._format_srt_time(entry.end_time)
@@ -112,7 +312,7 @@ class FileWriter:
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write("WEBVTT\n\n")
-                for entry in self.entries:
+                for entry in self._iter_entries():
                     if entry.start_time is not None and entry.end_time is not None:
                         start = self._format_vtt_time(entry.start_time)
                         end = self._format_vtt_time(entry.end_time)
@@ -128,14 +328,11 @@ class FileWriter:
             with open(output_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow(['timestamp', 'text', 'confidence', 'start_time', 'end_time'])
-                for entry in self.entries:
-                    writer.writerow([
-                        entry.timestamp,
-                        entry.text,
-                        entry.confidence,
-                        entry.start_time,
-                        entry.end_time
-                    ])
+                writer.writerows(
+                    (entry.timestamp, entry.text, entry.confidence,
+                     entry.start_time, entry.end_time)
+                    for entry in self._iter_entries()
+                )
             print(f"CSV transcript saved to: {output_file}")
         except Exception as e:
             print(f"Error writing CSV: {e}")
@@ -161,41 +358,44 @@ class FileWriter:
             else:
                 print(f"Warning: Unknown format '{format_name}' ignored")
     
+    @staticmethod
+    def _split_time(seconds: float) -> tuple:
+        """Split seconds into whole hours, minutes, seconds and milliseconds."""
+        secs, millis = divmod(round(seconds * 1000), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
+        return hours, minutes, secs, millis
+    
     def _format_srt_time(self, seconds: float) -> str:
         """Format time for SRT format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        hours, minutes, secs, millis = self._split_time(seconds)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
     
     def _format_vtt_time(self, seconds: float) -> str:
         """Format time for VTT format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
+        hours, minutes, secs, millis = self._split_time(seconds)
         if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+            return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
         else:
-            return f"{minutes:02d}:{secs:06.3f}"
+            return f"{minutes:02d}:{secs:02d}.{millis:03d}"
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the transcript."""
-        if not self.entries:
+        if not self._entry_count:
             return {"total_entries": 0, "total_text_length": 0}
         
-        total_text_length = sum(len(entry.text) for entry in self.entries)
-        first_timestamp = self.entries[0].timestamp
-        last_timestamp = self.entries[-1].timestamp
+        total_text_length = self._total_text_length
+        first_timestamp = self._first_timestamp
+        last_timestamp = self._last_timestamp
         duration = last_timestamp - first_timestamp
         
         return {
-            "total_entries": len(self.entries),
+            "total_entries": self._entry_count,
             "total_text_length": total_text_length,
             "first_entry": datetime.fromtimestamp(first_timestamp).isoformat(),
             "last_entry": datetime.fromtimestamp(last_timestamp).isoformat(),
             "duration_seconds": duration,
-            "avg_text_length": total_text_length / len(self.entries) if self.entries else 0
+            "avg_text_length": total_text_length / self._entry_count
         }
     
     def __enter__(self):
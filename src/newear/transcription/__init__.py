@@ -1,6 +1,18 @@
 """Speech transcription module using faster-whisper."""
 
-from .whisper_local import WhisperTranscriber
-from .models import ModelManager
+import importlib
 
-__all__ = ["WhisperTranscriber", "ModelManager"]
\ No newline at end of file
+__all__ = ["WhisperTranscriber", "ModelManager"]
+
+# Resolved on first access so importing one submodule (e.g. models for
+# metadata) doesn't load whisper_local and its numpy/faster-whisper stack
+_EXPORTS = {
+    "WhisperTranscriber": ".whisper_local",
+    "ModelManager": ".models",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
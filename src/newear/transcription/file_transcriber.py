@@ -1,119 +1,128 @@
 """File-based transcription for video and audio files."""
 
+import functools
 import os
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import Optional, List, Iterator, Dict
 import time
 
-from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
+import numpy as np
 
 from newear.transcription.whisper_local import WhisperTranscriber, TranscriptionResult
+from newear.utils.console import get_console
 from newear.utils.logging import get_logger
 
-console = Console()
 logger = get_logger()
 
 
 class FileTranscriber:
     """Handles transcription of video and audio files."""
     
-    SUPPORTED_AUDIO_FORMATS = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.aiff', '.aif'}
-    SUPPORTED_VIDEO_FORMATS = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v'}
+    SUPPORTED_AUDIO_FORMATS = frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.aiff', '.aif'})
+    SUPPORTED_VIDEO_FORMATS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v'})
+    SUPPORTED_FORMATS = SUPPORTED_AUDIO_FORMATS | SUPPORTED_VIDEO_FORMATS
+    _SORTED_FORMATS = tuple(sorted(SUPPORTED_FORMATS))
     
     def __init__(self, model_size: str = "base", language: Optional[str] = None, 
-                 device: str = "cpu", compute_type: str = "int8", 
-                 custom_models: Optional[Dict[str, str]] = None):
+                 device: str = "cpu", compute_type: str = "auto", 
+                 custom_models: Optional[Dict[str, str]] = None,
+                 cpu_threads: int = 0, num_workers: int = 1, batch_size: int = 0,
+                 initial_prompt: Optional[str] = None):
         """Initialize file transcriber."""
         self.model_size = model_size
         self.language = language
         self.device = device
         self.compute_type = compute_type
         self.custom_models = custom_models
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.initial_prompt = initial_prompt
         self.transcriber = None
+        # ffprobe durations keyed by (path, mtime, size)
+        self._durations: Dict[tuple, Optional[float]] = {}
         
     def _initialize_transcriber(self):
         """Initialize the Whisper transcriber."""
         if self.transcriber is None:
+            console = get_console()
             console.print(f"[blue]Initializing Whisper model: {self.model_size}[/blue]")
             self.transcriber = WhisperTranscriber(
                 model_size=self.model_size,
                 language=self.language,
                 device=self.device,
                 compute_type=self.compute_type,
-                custom_models=self.custom_models
+                custom_models=self.custom_models,
+                cpu_threads=self.cpu_threads,
+                num_workers=self.num_workers,
+                batch_size=self.batch_size,
+                initial_prompt=self.initial_prompt,
+                warmup=False  # A single file run gains nothing from warmup
             )
             console.print("[green]Model loaded successfully[/green]")
     
     def _is_supported_format(self, file_path: Path) -> bool:
         """Check if file format is supported."""
-        suffix = file_path.suffix.lower()
-        return suffix in self.SUPPORTED_AUDIO_FORMATS or suffix in self.SUPPORTED_VIDEO_FORMATS
+        return file_path.suffix.lower() in self.SUPPORTED_FORMATS
     
     def _is_video_format(self, file_path: Path) -> bool:
         """Check if file is a video format."""
         return file_path.suffix.lower() in self.SUPPORTED_VIDEO_FORMATS
     
-    def _extract_audio_from_video(self, video_path: Path) -> Path:
-        """Extract audio from video file using ffmpeg."""
+    def _extract_audio_array(self, video_path: Path) -> np.ndarray:
+        """Decode a video's audio track with ffmpeg into 16 kHz mono float32 samples.
+        
+        The PCM is read straight from ffmpeg's stdout, so no temporary WAV
+        file is written and read back.
+        """
         if not self._check_ffmpeg():
             raise RuntimeError("ffmpeg is required for video processing. Install with: brew install ffmpeg")
         
-        # Create temporary audio file
-        temp_audio = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        temp_audio.close()
-        temp_audio_path = Path(temp_audio.name)
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         
+        console = get_console()
         console.print(f"[blue]Extracting audio from video: {video_path.name}[/blue]")
         
-        try:
-            # Use ffmpeg to extract audio
-            cmd = [
-                'ffmpeg', '-i', str(video_path),
-                '-vn',  # No video
-                '-acodec', 'pcm_s16le',  # 16-bit PCM
-                '-ar', '16000',  # 16kHz sample rate
-                '-ac', '1',  # Mono
-                '-y',  # Overwrite output file
-                str(temp_audio_path)
-            ]
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True
-            ) as progress:
-                task = progress.add_task("Extracting audio...", total=None)
-                
-                result = subprocess.run(
-                    cmd, 
-                    capture_output=True, 
-                    text=True,
-                    check=True
-                )
-                
-                progress.update(task, completed=True)
+        cmd = [
+            'ffmpeg', '-i', str(video_path),
+            '-vn',  # No video
+            '-acodec', 'pcm_f32le',  # float32 PCM, the dtype faster-whisper consumes
+            '-ar', '16000',  # 16kHz sample rate
+            '-ac', '1',  # Mono
+            '-f', 'f32le',  # Raw samples, no WAV header
+            'pipe:1'
+        ]
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            transient=True
+        ) as progress:
+            task = progress.add_task("Extracting audio...", total=None)
             
-            console.print("[green]Audio extraction completed[/green]")
-            return temp_audio_path
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1 << 20
+            )
+            raw, err = process.communicate()
             
-        except subprocess.CalledProcessError as e:
-            console.print(f"[red]Error extracting audio: {e.stderr}[/red]")
-            # Clean up temp file
-            if temp_audio_path.exists():
-                temp_audio_path.unlink()
-            raise
-        except Exception as e:
-            console.print(f"[red]Unexpected error: {e}[/red]")
-            # Clean up temp file
-            if temp_audio_path.exists():
-                temp_audio_path.unlink()
-            raise
+            progress.update(task, completed=True)
+        
+        if process.returncode != 0:
+            stderr = err.decode(errors='replace')
+            console.print(f"[red]Error extracting audio: {stderr}[/red]")
+            raise subprocess.CalledProcessError(process.returncode, cmd, output=raw, stderr=stderr)
+        
+        console.print("[green]Audio extraction completed[/green]")
+        return np.frombuffer(raw, dtype=np.float32)
     
-    def _check_ffmpeg(self) -> bool:
-        """Check if ffmpeg is available."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _check_ffmpeg() -> bool:
+        """Check if ffmpeg is available (probed once per process)."""
         try:
             subprocess.run(['ffmpeg', '-version'], 
                          capture_output=True, check=True)
@@ -122,7 +131,19 @@ class FileTranscriber:
             return False
     
     def _get_file_duration(self, file_path: Path) -> Optional[float]:
-        """Get file duration using ffprobe."""
+        """Get file duration using ffprobe, cached until the file changes."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key not in self._durations:
+            self._durations[key] = self._probe_duration(file_path)
+        return self._durations[key]
+    
+    @staticmethod
+    def _probe_duration(file_path: Path) -> Optional[float]:
+        """Run ffprobe for the container duration."""
         try:
             cmd = [
                 'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
@@ -147,73 +168,78 @@ class FileTranscriber:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         if not self._is_supported_format(file_path):
-            supported = list(self.SUPPORTED_AUDIO_FORMATS | self.SUPPORTED_VIDEO_FORMATS)
+            supported = list(self._SORTED_FORMATS)
             raise ValueError(f"Unsupported file format. Supported formats: {supported}")
         
         # Initialize transcriber
         self._initialize_transcriber()
         
-        # Extract audio if it's a video file
-        temp_audio_path = None
-        audio_path = file_path
-        
+        # Video soundtracks are decoded in memory; audio files are passed
+        # to the transcriber by path
         if self._is_video_format(file_path):
-            temp_audio_path = self._extract_audio_from_video(file_path)
-            audio_path = temp_audio_path
+            audio = self._extract_audio_array(file_path)
+            duration = len(audio) / 16000
+        else:
+            audio = str(file_path)
+            duration = self._get_file_duration(file_path)
         
-        try:
-            # Get file duration for progress tracking
-            duration = self._get_file_duration(audio_path)
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+        
+        console = get_console()
+        console.print(f"[blue]Starting transcription of: {file_path.name}[/blue]")
+        if duration:
+            console.print(f"[blue]File duration: {duration:.1f} seconds[/blue]")
+        
+        # Transcribe the audio file
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            "[progress.percentage]{task.percentage:>3.0f}%",
+            "•",
+            TimeRemainingColumn(),
+            console=console
+        ) as progress:
             
-            console.print(f"[blue]Starting transcription of: {file_path.name}[/blue]")
             if duration:
-                console.print(f"[blue]File duration: {duration:.1f} seconds[/blue]")
+                task = progress.add_task("Transcribing...", total=duration)
+            else:
+                task = progress.add_task("Transcribing...", total=None)
+            
+            # Use the transcriber to process the file
+            last_update = 0
             
-            # Transcribe the audio file
-            with Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                "[progress.percentage]{task.percentage:>3.0f}%",
-                "•",
-                TimeRemainingColumn(),
-                console=console
-            ) as progress:
-                
-                if duration:
-                    task = progress.add_task("Transcribing...", total=duration)
-                else:
-                    task = progress.add_task("Transcribing...", total=None)
-                
-                # Use the transcriber to process the file
-                start_time = time.time()
-                
-                # Create a generator that yields transcription results
-                for result in self.transcriber.transcribe_file(str(audio_path)):
-                    if result and result.text.strip():
-                        # Update progress based on time elapsed
-                        if duration:
-                            elapsed = time.time() - start_time
-                            progress.update(task, completed=min(elapsed, duration))
-                        
-                        yield result
-                
-                # Complete the progress bar
-                if duration:
-                    progress.update(task, completed=duration)
-                else:
-                    progress.update(task, completed=100)
+            # Batched decoding when configured, otherwise VAD-cut chunks in
+            # parallel with several model workers
+            if self.batch_size > 0:
+                results = self.transcriber.transcribe_file_batched(audio)
+            elif self.num_workers > 1:
+                results = self.transcriber.transcribe_file_parallel(audio)
+            else:
+                results = self.transcriber.transcribe_file(audio)
             
-            console.print("[green]Transcription completed successfully[/green]")
+            # Create a generator that yields transcription results
+            for result in results:
+                if result and result.text.strip():
+                    # Advance to the segment's audio position, at most 10 times a second
+                    if duration:
+                        now = time.monotonic_ns()
+                        if now - last_update > 100_000_000:
+                            last_update = now
+                            progress.update(task, completed=min(result.end_time, duration))
+                    
+                    yield result
             
-        finally:
-            # Clean up temporary audio file if created
-            if temp_audio_path and temp_audio_path.exists():
-                temp_audio_path.unlink()
-                logger.debug(f"Cleaned up temporary audio file: {temp_audio_path}")
+            # Complete the progress bar
+            if duration:
+                progress.update(task, completed=duration)
+            else:
+                progress.update(task, completed=100)
+        
+        console.print("[green]Transcription completed successfully[/green]")
     
     def get_supported_formats(self) -> List[str]:
         """Get list of supported file formats."""
-        return sorted(list(self.SUPPORTED_AUDIO_FORMATS | self.SUPPORTED_VIDEO_FORMATS))
+        return list(self._SORTED_FORMATS)
     
     def cleanup(self):
         """Clean up resources."""
@@ -6,10 +6,19 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
 
-from rich.console import Console
-from rich.progress import Progress, DownloadColumn, BarColumn, TextColumn, TimeRemainingColumn
+from newear.utils.console import get_console
 
-console = Console()
+
+MODEL_FILE_SUFFIXES = ('.bin', '.pt', '.onnx')
+
+
+def _dir_has_model_file(path: Path) -> bool:
+    """Check for model weights in a directory with a single scandir pass."""
+    try:
+        with os.scandir(path) as entries:
+            return any(e.name.endswith(MODEL_FILE_SUFFIXES) and e.is_file() for e in entries)
+    except OSError:
+        return False
 
 
 @dataclass
@@ -26,6 +35,14 @@ class ModelInfo:
 class ModelManager:
     """Manages Whisper model downloads and storage."""
     
+    # RAM usage relative to model size during inference, by compute type
+    RAM_MULTIPLIERS: Dict[str, float] = {
+        "float32": 1.8,
+        "float16": 1.2,
+        "int8": 0.9,
+        "int8_float16": 0.6,
+    }
+    
     # Available models with their approximate sizes
     MODELS: Dict[str, ModelInfo] = {
         "tiny": ModelInfo(
@@ -66,13 +83,17 @@ class ModelManager:
         )
     }
     
-    def __init__(self, models_dir: Optional[Path] = None, custom_models: Optional[Dict[str, str]] = None):
+    def __init__(self, models_dir: Optional[Path] = None, custom_models: Optional[Dict[str, str]] = None,
+                 console=None):
         """Initialize model manager.
         
         Args:
             models_dir: Directory for model storage
             custom_models: Dict mapping custom model names to paths
+            console: Rich console for output (created on first use if None)
         """
+        self._console = console
+        
         if models_dir is None:
             # Default to models/ directory in project root
             project_root = Path(__file__).parent.parent.parent.parent
@@ -89,6 +110,15 @@ class ModelManager:
         # Initialize custom models registry
         self.custom_models = custom_models or {}
         self._register_custom_models()
+        
+        # Path validation results keyed by (path, mtime_ns); a directory's
+        # mtime changes when model files are added or removed
+        self._validated: Dict[tuple, bool] = {}
+    
+    @property
+    def console(self):
+        """Rich console used for output."""
+        return self._console or get_console()
     
     def _register_custom_models(self):
         """Register custom models in the main models registry."""
@@ -169,10 +199,18 @@ class ModelManager:
             return True
         
         # Check if path exists
-        path_obj = Path(path)
-        if not path_obj.exists():
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
             return False
         
+        key = (path, mtime_ns)
+        if key not in self._validated:
+            self._validated[key] = self._check_model_path(Path(path))
+        return self._validated[key]
+    
+    def _check_model_path(self, path_obj: Path) -> bool:
+        """Check that an existing path looks like a model file or directory."""
         # Check if it's a file or directory
         if path_obj.is_file():
             # Could add more sophisticated model file validation here
@@ -180,7 +218,7 @@ class ModelManager:
         elif path_obj.is_dir():
             # Check if directory contains model files
             # This is a basic check - could be enhanced
-            return any(path_obj.glob('*.bin')) or any(path_obj.glob('*.pt')) or any(path_obj.glob('*.onnx'))
+            return _dir_has_model_file(path_obj)
         
         return False
     
@@ -214,12 +252,12 @@ class ModelManager:
             # Check if it's a valid model file/directory
             if path_obj.is_file():
                 # Basic file validation
-                if not path_obj.suffix.lower() in ['.bin', '.pt', '.onnx']:
+                if not path_obj.suffix.lower() in MODEL_FILE_SUFFIXES:
                     return f"Unsupported model file format: {path_obj.suffix}. Expected .bin, .pt, or .onnx"
                 return None
             elif path_obj.is_dir():
                 # Check if directory contains model files
-                has_model_files = any(path_obj.glob('*.bin')) or any(path_obj.glob('*.pt')) or any(path_obj.glob('*.onnx'))
+                has_model_files = _dir_has_model_file(path_obj)
                 if not has_model_files:
                     return f"Directory '{resolved_path}' does not contain model files (.bin, .pt, .onnx)"
                 return None
@@ -270,6 +308,7 @@ class ModelManager:
     
     def print_model_info(self):
         """Print information about all available models."""
+        console = self.console
         console.print("\n[bold]Available Whisper Models:[/bold]")
         console.print("-" * 80)
         
@@ -296,17 +335,18 @@ class ModelManager:
         console.print("[yellow]Note: Built-in models are downloaded automatically on first use[/yellow]")
         console.print(f"[blue]Recommended for general use: {self.get_recommended_model()}[/blue]")
     
-    def estimate_memory_usage(self, model_name: str) -> Dict[str, int]:
-        """Estimate memory usage for a model."""
+    def estimate_memory_usage(self, model_name: str, compute_type: str = "float32") -> Dict[str, int]:
+        """Estimate memory usage for a model loaded with the given compute type."""
         if model_name not in self.MODELS:
             return {"disk_mb": 0, "ram_mb": 0}
         
         model_info = self.MODELS[model_name]
         
-        # Rough estimates based on model size
-        # RAM usage is typically 1.5-2x model size during inference
+        # Rough estimates based on model size; quantized weights take
+        # proportionally less RAM during inference
         disk_mb = model_info.size_mb
-        ram_mb = int(model_info.size_mb * 1.8)  # Conservative estimate
+        multiplier = self.RAM_MULTIPLIERS.get(compute_type, 1.8)
+        ram_mb = int(model_info.size_mb * multiplier)
         
         return {
             "disk_mb": disk_mb,
@@ -325,7 +365,7 @@ class ModelManager:
         """Clean up downloaded models (if needed)."""
         # For faster-whisper, models are managed by the library
         # This is a placeholder for potential future cleanup needs
-        console.print("[yellow]Model cleanup not needed for faster-whisper[/yellow]")
+        self.console.print("[yellow]Model cleanup not needed for faster-whisper[/yellow]")
     
     def get_storage_info(self) -> Dict[str, any]:
         """Get information about model storage."""
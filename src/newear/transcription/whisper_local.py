@@ -1,18 +1,110 @@
 """Local Whisper transcription using faster-whisper."""
 
+import math
+import os
 import numpy as np
 import threading
 import queue
 import time
-from typing import Optional, Generator, Dict, Any, List, Iterator
+from typing import Optional, Generator, Dict, Any, List, Iterator, Union, TYPE_CHECKING
 from dataclasses import dataclass
 
-from faster_whisper import WhisperModel
-from rich.console import Console
+from newear.utils.console import get_console
 
 from .models import ModelManager
 
-console = Console()
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+
+# Compute types picked when compute_type is "auto", keyed by device
+AUTO_COMPUTE_TYPES = {
+    "cuda": "int8_float16",
+    "cpu": "int8",
+}
+
+
+def resolve_compute_type(compute_type: str, device: str) -> str:
+    """Resolve the "auto" compute type to a concrete one for the device."""
+    if compute_type != "auto":
+        return compute_type
+    if device == "auto":
+        import ctranslate2
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    return AUTO_COMPUTE_TYPES.get(device, "int8")
+
+# (scale, bias) mapping integer PCM samples into [-1, 1]
+PCM_SCALES = {
+    np.dtype(np.uint8): (np.float32(1 / 128.0), np.float32(-1.0)),
+    np.dtype(np.int16): (np.float32(1 / 32768.0), None),
+    np.dtype(np.int32): (np.float32(1 / 2147483648.0), None),
+}
+
+
+def normalize_audio(audio_data: np.ndarray) -> np.ndarray:
+    """Convert audio to float32 in the [-1, 1] range.
+    
+    Integer PCM is cast and scaled in a single pass. Float audio is only
+    rescaled when it peaks above 1.0, and is returned as-is otherwise.
+    """
+    pcm_scale = PCM_SCALES.get(audio_data.dtype)
+    if pcm_scale is not None:
+        scale, bias = pcm_scale
+        audio_data = np.multiply(audio_data, scale, dtype=np.float32)
+        if bias is not None:
+            audio_data += bias
+        return audio_data
+    
+    audio_data = audio_data.astype(np.float32, copy=False)
+    if audio_data.size:
+        # max/min reductions avoid allocating an abs() temporary
+        peak = max(float(audio_data.max()), -float(audio_data.min()))
+        if peak > 1.0:
+            audio_data = np.multiply(audio_data, np.float32(1.0 / peak), dtype=np.float32)
+    return audio_data
+
+
+# Sample rate Whisper models expect
+WHISPER_SAMPLE_RATE = 16000
+
+
+def resample_audio(audio_data: np.ndarray, orig_sr: int,
+                   target_sr: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """Resample float32 audio to the target rate.
+    
+    Uses soxr's polyphase resampler when installed (pip install newear[resample]),
+    otherwise falls back to linear interpolation.
+    """
+    if orig_sr == target_sr or not audio_data.size:
+        return audio_data
+    
+    try:
+        import soxr
+    except ImportError:
+        soxr = None
+    
+    if soxr is not None:
+        return soxr.resample(audio_data, orig_sr, target_sr)
+    
+    target_len = int(round(len(audio_data) * target_sr / orig_sr))
+    positions = np.arange(target_len, dtype=np.float32) * np.float32(orig_sr / target_sr)
+    return np.interp(positions, np.arange(len(audio_data), dtype=np.float32),
+                     audio_data).astype(np.float32)
+
+
+def vad_parameters_for(duration: float) -> Dict[str, Any]:
+    """Pick VAD parameters suited to the audio length in seconds.
+    
+    Short interactive chunks shouldn't wait out a long silence tail, while
+    long-form audio needs a longer gap before splitting speech.
+    """
+    if duration < 3.0:
+        min_silence_ms = 200
+    elif duration <= 30.0:
+        min_silence_ms = 500
+    else:
+        min_silence_ms = 1000
+    return dict(min_silence_duration_ms=min_silence_ms)
 
 
 @dataclass
@@ -39,30 +131,47 @@ class WhisperTranscriber:
     """Real-time transcription using faster-whisper."""
     
     def __init__(self, model_size: str = "base", language: Optional[str] = None, 
-                 device: str = "cpu", compute_type: str = "int8", 
+                 device: str = "cpu", compute_type: str = "auto", 
                  download_root: Optional[str] = None, local_files_only: bool = False,
-                 custom_models: Optional[Dict[str, str]] = None):
+                 custom_models: Optional[Dict[str, str]] = None, warmup: bool = True,
+                 cpu_threads: int = 0, num_workers: int = 1, batch_size: int = 0,
+                 initial_prompt: Optional[str] = None):
         """Initialize the transcriber.
         
         Args:
             model_size: Whisper model size/name or path (tiny, base, small, medium, large, custom name, or file path)
             language: Target language code (None for auto-detection)
             device: Device to use ("cpu" or "cuda")
-            compute_type: Compute type for inference ("int8", "float16", "float32")
+            compute_type: Compute type for inference ("auto", "int8", "int8_float16",
+                "float16", "float32"). "auto" uses int8_float16 on CUDA and int8 on CPU
             download_root: Custom download directory (None for default)
             local_files_only: Use only local files, no download
             custom_models: Dict mapping custom model names to paths
+            warmup: Run a short silent transcription after loading so the first
+                real chunk doesn't pay kernel selection and buffer allocation cost
+            cpu_threads: CTranslate2 threads on CPU (0 for min(8, cpu count))
+            num_workers: Number of model workers for concurrent transcriptions
+            batch_size: Segments per batch for transcribe_file_batched()
+            initial_prompt: Text to prime the decoder with (e.g. domain vocabulary)
         """
         self.model_size = model_size
         self.language = language
         self.device = device
+        # "auto" is resolved when the model is created, which may need ctranslate2
         self.compute_type = compute_type
         self.download_root = download_root
         self.local_files_only = local_files_only
+        self.warmup = warmup
+        self.cpu_threads = cpu_threads or min(8, os.cpu_count() or 1)
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.initial_prompt = initial_prompt
+        self._initial_prompt_tokens: Optional[List[int]] = None
         
         self.model_manager = ModelManager(custom_models=custom_models)
-        self.model: Optional[WhisperModel] = None
+        self.model: Optional["WhisperModel"] = None
         self.is_loaded = False
+        self._batched_pipeline = None
         
         # Performance monitoring
         self.transcription_times: List[float] = []
@@ -73,50 +182,98 @@ class WhisperTranscriber:
             return True
             
         try:
-            console.print(f"[blue]Loading Whisper model: {self.model_size}[/blue]")
+            get_console().print(f"[blue]Loading Whisper model: {self.model_size}[/blue]")
             
             # Validate model name/path
             validation_error = self.model_manager.get_model_validation_error(self.model_size)
             if validation_error:
-                console.print(f"[red]Model validation error: {validation_error}[/red]")
-                console.print(f"[yellow]Use 'newear --list-models' to see available models[/yellow]")
+                get_console().print(f"[red]Model validation error: {validation_error}[/red]")
+                get_console().print(f"[yellow]Use 'newear --list-models' to see available models[/yellow]")
                 return False
             
             # Get resolved model path
             model_path = self.model_manager.get_model_path(self.model_size)
             
             # Load model with faster-whisper
-            self.model = WhisperModel(
-                model_path,
-                device=self.device,
-                compute_type=self.compute_type,
-                download_root=self.download_root,
-                local_files_only=self.local_files_only
-            )
+            try:
+                self.model = self._create_model(model_path, self.compute_type)
+            except ValueError:
+                # Older GPUs lack int8_float16 kernels, fall back to plain int8
+                if self.compute_type != "int8_float16":
+                    raise
+                get_console().print("[yellow]int8_float16 not supported on this device, falling back to int8[/yellow]")
+                self.compute_type = "int8"
+                self.model = self._create_model(model_path, self.compute_type)
             
             self.is_loaded = True
-            console.print(f"[green]Model loaded successfully: {self.model_size}[/green]")
+            get_console().print(f"[green]Model loaded successfully: {self.model_size}[/green]")
+            
+            if self.warmup:
+                self._warmup_model()
             
             # Print model info
             model_info = self.model_manager.get_model_info(self.model_size)
             if model_info:
                 if model_info.is_custom:
-                    console.print(f"[dim]Custom model: {model_info.description}[/dim]")
-                    console.print(f"[dim]Path: {model_info.path}[/dim]")
+                    get_console().print(f"[dim]Custom model: {model_info.description}[/dim]")
+                    get_console().print(f"[dim]Path: {model_info.path}[/dim]")
                 else:
-                    console.print(f"[dim]Model size: {model_info.size_mb}MB, {model_info.description}[/dim]")
+                    get_console().print(f"[dim]Model size: {model_info.size_mb}MB, {model_info.description}[/dim]")
             
             return True
             
         except Exception as e:
-            console.print(f"[red]Failed to load model '{self.model_size}': {e}[/red]")
+            get_console().print(f"[red]Failed to load model '{self.model_size}': {e}[/red]")
             # Provide helpful error message for common issues
             if "No such file or directory" in str(e):
-                console.print(f"[yellow]Tip: Check if the model path exists or if it's a valid model name[/yellow]")
+                get_console().print(f"[yellow]Tip: Check if the model path exists or if it's a valid model name[/yellow]")
             elif "Invalid model" in str(e):
-                console.print(f"[yellow]Tip: Use 'newear --list-models' to see available models[/yellow]")
+                get_console().print(f"[yellow]Tip: Use 'newear --list-models' to see available models[/yellow]")
             return False
     
+    def _create_model(self, model_path: str, compute_type: str) -> "WhisperModel":
+        """Create the faster-whisper model with the given compute type."""
+        # Imported here so CLI paths that never load a model (--list-devices,
+        # config commands) don't pay for importing faster-whisper/ctranslate2
+        from faster_whisper import WhisperModel
+        
+        # Recorded so the int8 fallback and get_model_info see the concrete type
+        compute_type = resolve_compute_type(compute_type, self.device)
+        self.compute_type = compute_type
+        return WhisperModel(
+            model_path,
+            device=self.device,
+            compute_type=compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+            download_root=self.download_root,
+            local_files_only=self.local_files_only
+        )
+    
+    def _get_initial_prompt_tokens(self) -> Optional[List[int]]:
+        """Tokenize the initial prompt once and reuse the ids for every call."""
+        if not self.initial_prompt:
+            return None
+        if self._initial_prompt_tokens is None:
+            # Same encoding faster-whisper applies to a string prompt
+            self._initial_prompt_tokens = self.model.hf_tokenizer.encode(
+                " " + self.initial_prompt.strip(), add_special_tokens=False
+            ).ids
+        return self._initial_prompt_tokens
+    
+    def _warmup_model(self):
+        """Run one transcription over a second of silence to warm up the model."""
+        try:
+            segments, _ = self.model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language=self.language or "en",
+                vad_filter=False
+            )
+            # Segments are lazy, consume them to actually run the decoder
+            list(segments)
+        except Exception as e:
+            get_console().print(f"[yellow]Model warmup failed: {e}[/yellow]")
+    
     def transcribe_audio(self, audio_data: np.ndarray, 
                         sample_rate: int = 16000) -> Optional[TranscriptionResult]:
         """Transcribe audio data.
@@ -135,13 +292,8 @@ class WhisperTranscriber:
         try:
             start_time = time.time()
             
-            # Ensure audio is float32 and normalized
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-            
-            # Normalize audio to [-1, 1] range if needed
-            if np.max(np.abs(audio_data)) > 1.0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
+            audio_data = normalize_audio(audio_data)
+            audio_data = resample_audio(audio_data, sample_rate)
             
             # Transcribe with faster-whisper
             segments, info = self.model.transcribe(
@@ -149,28 +301,36 @@ class WhisperTranscriber:
                 language=self.language,
                 task="transcribe",
                 vad_filter=True,  # Voice activity detection
-                vad_parameters=dict(min_silence_duration_ms=500),
+                vad_parameters=vad_parameters_for(len(audio_data) / WHISPER_SAMPLE_RATE),
+                initial_prompt=self._get_initial_prompt_tokens(),
                 word_timestamps=False
             )
             
-            # Collect all segments
-            transcription_segments = list(segments)
+            # Fold segments in as the decoder yields them, without
+            # materializing the whole segment list first
+            text_parts = []
+            logprob_sum = 0.0
+            segment_count = 0
+            start_seg_time = end_seg_time = 0.0
+            for segment in segments:
+                if segment_count == 0:
+                    start_seg_time = segment.start
+                end_seg_time = segment.end
+                text_parts.append(segment.text.strip())
+                logprob_sum += getattr(segment, 'avg_logprob', 0)
+                segment_count += 1
             
-            if not transcription_segments:
+            if not segment_count:
                 return None
             
             # Combine segments into single result
-            full_text = " ".join([segment.text.strip() for segment in transcription_segments])
+            full_text = " ".join(text_parts)
             
             if not full_text.strip():
                 return None
             
-            # Get timing information
-            start_seg_time = transcription_segments[0].start
-            end_seg_time = transcription_segments[-1].end
-            
             # Calculate average confidence (if available)
-            avg_confidence = sum(getattr(seg, 'avg_logprob', 0) for seg in transcription_segments) / len(transcription_segments)
+            avg_confidence = logprob_sum / segment_count
             # Convert log probability to confidence score (0-1)
             confidence = min(1.0, max(0.0, (avg_confidence + 1.0) / 2.0))
             
@@ -193,7 +353,7 @@ class WhisperTranscriber:
             return result
             
         except Exception as e:
-            console.print(f"[red]Transcription error: {e}[/red]")
+            get_console().print(f"[red]Transcription error: {e}[/red]")
             return None
     
     def transcribe_chunk_stream(self, audio_chunks: Generator[np.ndarray, None, None],
@@ -211,19 +371,20 @@ class WhisperTranscriber:
             if not self.load_model():
                 return
         
-        console.print("[green]Starting real-time transcription...[/green]")
+        get_console().print("[green]Starting real-time transcription...[/green]")
         
         for chunk in audio_chunks:
             if chunk is None:
                 continue
                 
-            # Only transcribe if there's sufficient audio energy
-            rms = np.sqrt(np.mean(chunk ** 2))
+            # Only transcribe if there's sufficient audio energy (empty chunks count as silence)
+            rms = math.sqrt(float(chunk @ chunk) / chunk.size) if chunk.size else 0.0
             if rms < 0.001:  # Same threshold as Phase 1
                 continue
             
+            # transcribe_audio returns None for silent/empty chunks
             result = self.transcribe_audio(chunk, sample_rate)
-            if result and result.text.strip():
+            if result is not None:
                 yield result
     
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -242,14 +403,15 @@ class WhisperTranscriber:
             "model_size": self.model_size,
             "is_custom_model": is_custom,
             "device": self.device,
-            "compute_type": self.compute_type
+            "compute_type": self.compute_type,
+            "cpu_threads": self.cpu_threads
         }
     
-    def transcribe_file(self, file_path: str) -> Iterator[TranscriptionResult]:
+    def transcribe_file(self, file_path: Union[str, np.ndarray]) -> Iterator[TranscriptionResult]:
         """Transcribe an audio file.
         
         Args:
-            file_path: Path to the audio file
+            file_path: Path to the audio file, or 16 kHz mono float32 samples
             
         Yields:
             TranscriptionResult: Individual transcription segments
@@ -267,28 +429,15 @@ class WhisperTranscriber:
                 language=self.language,
                 vad_filter=True,  # Voice activity detection
                 vad_parameters=dict(min_silence_duration_ms=500),
+                initial_prompt=self._get_initial_prompt_tokens(),
                 word_timestamps=True
             )
             
+            language = info.language if hasattr(info, 'language') else self.language
+            
             # Process each segment
             for segment in segments:
-                # Calculate confidence (faster-whisper doesn't provide segment confidence)
-                # Use average word confidence if available, otherwise use a default
-                confidence = 0.8  # Default confidence for file transcription
-                
-                if hasattr(segment, 'words') and segment.words:
-                    word_confidences = [w.probability for w in segment.words if hasattr(w, 'probability')]
-                    if word_confidences:
-                        confidence = sum(word_confidences) / len(word_confidences)
-                
-                # Create result
-                result = TranscriptionResult(
-                    text=segment.text,
-                    confidence=confidence,
-                    start_time=segment.start,
-                    end_time=segment.end,
-                    language=info.language if hasattr(info, 'language') else self.language
-                )
+                result = self._segment_result(segment, language)
                 
                 # Track performance
                 self.transcription_times.append(time.time() - start_time)
@@ -296,16 +445,180 @@ class WhisperTranscriber:
                 yield result
                 
         except Exception as e:
-            console.print(f"[red]Error transcribing file: {e}[/red]")
+            get_console().print(f"[red]Error transcribing file: {e}[/red]")
+            return
+    
+    def transcribe_file_batched(self, file_path: Union[str, np.ndarray]) -> Iterator[TranscriptionResult]:
+        """Transcribe an audio file with faster-whisper's batched pipeline.
+        
+        VAD-cut segments go through the encoder and decoder batch_size at a
+        time, which keeps the model's matrix multiplies busy. Falls back to
+        transcribe_file() when the installed faster-whisper predates
+        BatchedInferencePipeline.
+        
+        Args:
+            file_path: Path to the audio file, or 16 kHz mono float32 samples
+            
+        Yields:
+            TranscriptionResult: Individual transcription segments
+        """
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            get_console().print("[yellow]Batched transcription needs faster-whisper 1.1+, transcribing sequentially[/yellow]")
+            yield from self.transcribe_file(file_path)
             return
+        
+        if not self.is_loaded:
+            if not self.load_model():
+                return
+        
+        try:
+            start_time = time.time()
+            
+            if self._batched_pipeline is None:
+                self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+            
+            segments, info = self._batched_pipeline.transcribe(
+                file_path,
+                language=self.language,
+                batch_size=max(1, self.batch_size),
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500),
+                # The batched pipeline tokenizes the prompt itself and only
+                # accepts a string, unlike WhisperModel.transcribe
+                initial_prompt=self.initial_prompt,
+                word_timestamps=True
+            )
+            language = info.language if hasattr(info, 'language') else self.language
+            
+            for segment in segments:
+                result = self._segment_result(segment, language)
+                self.transcription_times.append(time.time() - start_time)
+                yield result
+                
+        except Exception as e:
+            get_console().print(f"[red]Error transcribing file: {e}[/red]")
+            return
+    
+    def transcribe_file_parallel(self, file_path: Union[str, np.ndarray],
+                                 max_workers: Optional[int] = None,
+                                 chunk_s: float = 30.0) -> Iterator[TranscriptionResult]:
+        """Transcribe an audio file as VAD-aligned chunks decoded concurrently.
+        
+        Speech found by faster-whisper's Silero VAD is packed into chunks of
+        at most chunk_s seconds, cut only at silences, and the chunks are
+        transcribed on a thread pool. CTranslate2 releases the GIL and runs
+        up to num_workers transcriptions at once, so this pays off when the
+        model was loaded with num_workers > 1.
+        
+        Args:
+            file_path: Path to the audio file, or 16 kHz mono float32 samples
+            max_workers: Chunks decoded at once (defaults to num_workers)
+            chunk_s: Longest chunk in seconds; Whisper's window is 30s
+            
+        Yields:
+            TranscriptionResult: Segments in time order, with file-relative times
+        """
+        if not self.is_loaded:
+            if not self.load_model():
+                return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        from faster_whisper.audio import decode_audio
+        
+        executor = None
+        try:
+            audio = file_path
+            if not isinstance(audio, np.ndarray):
+                audio = decode_audio(audio, sampling_rate=16000)
+            
+            chunks = self._vad_chunks(audio, chunk_s)
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers or self.num_workers,
+                thread_name_prefix="whisper-chunk"
+            )
+            
+            # map() hands results back in submission order, which keeps the
+            # output in time order whichever chunk finishes first
+            decoded = executor.map(
+                self._transcribe_chunk, (audio[start:end] for start, end in chunks)
+            )
+            for (start, _), (segments, language, elapsed) in zip(chunks, decoded):
+                self.transcription_times.append(elapsed)
+                offset = start / 16000
+                for segment in segments:
+                    yield self._segment_result(segment, language, offset)
+                    
+        except Exception as e:
+            get_console().print(f"[red]Error transcribing file: {e}[/red]")
+            return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _vad_chunks(self, audio: np.ndarray, chunk_s: float) -> List[tuple]:
+        """Group detected speech into (start, end) sample ranges of at most chunk_s."""
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        
+        max_samples = int(chunk_s * 16000)
+        speech = get_speech_timestamps(
+            audio,
+            VadOptions(min_silence_duration_ms=500, max_speech_duration_s=chunk_s)
+        )
+        
+        chunks = []
+        for region in speech:
+            if chunks and region['end'] - chunks[-1][0] <= max_samples:
+                chunks[-1][1] = region['end']
+            else:
+                chunks.append([region['start'], region['end']])
+        return [tuple(chunk) for chunk in chunks]
+    
+    def _transcribe_chunk(self, samples: np.ndarray) -> tuple:
+        """Transcribe one chunk on a pool thread; returns (segments, language, seconds)."""
+        start_time = time.time()
+        segments, info = self.model.transcribe(
+            samples,
+            language=self.language,
+            vad_filter=False,  # Chunks are already cut to speech
+            initial_prompt=self._get_initial_prompt_tokens(),
+            word_timestamps=True
+        )
+        # Segments are lazy, consume them here so decoding runs on this thread
+        segments = list(segments)
+        language = info.language if hasattr(info, 'language') else self.language
+        return segments, language, time.time() - start_time
+    
+    def _segment_result(self, segment, language: Optional[str],
+                        offset: float = 0.0) -> TranscriptionResult:
+        """Build a TranscriptionResult from a faster-whisper segment."""
+        # Calculate confidence (faster-whisper doesn't provide segment confidence)
+        # Use average word confidence if available, otherwise use a default
+        confidence = 0.8  # Default confidence for file transcription
+        
+        if hasattr(segment, 'words') and segment.words:
+            word_confidences = [w.probability for w in segment.words if hasattr(w, 'probability')]
+            if word_confidences:
+                confidence = sum(word_confidences) / len(word_confidences)
+        
+        return TranscriptionResult(
+            text=segment.text,
+            confidence=confidence,
+            start_time=segment.start + offset,
+            end_time=segment.end + offset,
+            language=language
+        )
     
     def cleanup(self):
         """Clean up resources."""
         if self.model:
             # faster-whisper models are automatically cleaned up
             self.model = None
+        self._batched_pipeline = None
+        self._initial_prompt_tokens = None
         self.is_loaded = False
-        console.print("[yellow]Transcriber cleaned up[/yellow]")
+        get_console().print("[yellow]Transcriber cleaned up[/yellow]")
     
     def __enter__(self):
         """Context manager entry."""
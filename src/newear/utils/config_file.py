@@ -12,6 +12,11 @@ from rich.console import Console
 
 console = Console()
 
+# libyaml's loader parses configs roughly 10x faster when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
 
 def expand_env_vars(data: Any) -> Any:
     """Recursively expand environment variables in configuration data."""
@@ -29,7 +34,7 @@ def expand_env_vars(data: Any) -> Any:
             else:
                 return os.getenv(var_expr, match.group(0))  # Return original if not found
         
-        return re.sub(r'\$\{([^}]+)\}', replace_var, data)
+        return _ENV_VAR_PATTERN.sub(replace_var, data)
     else:
         return data
 
@@ -50,8 +55,13 @@ class TranscriptionConfig:
     model_size: str = "base"
     language: Optional[str] = None
     device: str = "cpu"
-    compute_type: str = "int8"
+    compute_type: str = "auto"
     confidence_threshold: float = 0.7
+    warmup: bool = True
+    cpu_threads: int = 0
+    num_workers: int = 1
+    batch_size: int = 0
+    initial_prompt: Optional[str] = None
 
 
 @dataclass
@@ -71,7 +81,8 @@ class DisplayConfig:
     rich_ui: bool = True
     max_lines: int = 6
     show_stats: bool = True
-    update_interval: float = 0.1
+    update_interval: float = 1.0
+    full_screen: bool = True
     color_scheme: str = "auto"
 
 
@@ -87,12 +98,18 @@ class HookConfig:
     """Hook configuration settings."""
     enabled: bool = True
     hooks: List[Dict[str, Any]] = field(default_factory=list)  # List of hook definitions
+    filters: Dict[str, Any] = field(default_factory=dict)  # min_text_length, min_confidence
+    
+    def has_any_hooks(self) -> bool:
+        """Check whether hooks are enabled and at least one is defined."""
+        return self.enabled and bool(self.hooks)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'enabled': self.enabled,
-            'hooks': self.hooks
+            'hooks': self.hooks,
+            'filters': self.filters
         }
 
 
@@ -166,7 +183,7 @@ class ConfigManager:
             
             with open(config_file, 'r') as f:
                 if config_file.suffix == '.yaml' or config_file.suffix == '.yml':
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YamlLoader)
                 elif config_file.suffix == '.toml':
                     data = toml.load(f)
                 else:
@@ -242,8 +259,13 @@ transcription:
   model_size: "base"        # Whisper model size (tiny, base, small, medium, large)
   language: null            # Language code (null for auto-detect)
   device: "cpu"             # Processing device (cpu, cuda)
-  compute_type: "int8"      # Compute type (int8, float16, float32)
+  compute_type: "auto"      # Compute type (auto, int8, int8_float16, float16, float32)
   confidence_threshold: 0.7 # Confidence threshold for high-confidence chunks
+  warmup: true              # Warm up the model after loading for a faster first chunk
+  cpu_threads: 0            # CPU inference threads (0 = min(8, CPU count))
+  num_workers: 1            # Model workers (>1 decodes file chunks in parallel)
+  batch_size: 0             # File transcription batch size (0 = off, e.g. 8-16)
+  initial_prompt: null      # Text to prime the decoder with, e.g. domain vocabulary
 
 # Output settings
 output:
@@ -259,7 +281,8 @@ display:
   rich_ui: true            # Use rich terminal UI
   max_lines: 6             # Maximum lines to show in terminal
   show_stats: true         # Show statistics
-  update_interval: 0.1     # Display update interval in seconds
+  update_interval: 1.0     # Seconds between idle redraws (new text shows immediately)
+  full_screen: true        # Use the terminal's alternate screen (false=draw inline)
   color_scheme: "auto"     # Color scheme (auto, light, dark)
 
 # Custom model settings
@@ -273,6 +296,9 @@ models:
 # Hook settings
 hooks:
   enabled: true            # Enable/disable hook system
+  filters:                 # Skip all hooks for chunks that fail these checks
+    min_text_length: 1     # Minimum characters of transcribed text
+    min_confidence: 0.0    # Minimum confidence (0-1); hooks also accept min_confidence
   hooks:                   # Hook definitions
     # Example: Console log hook
     # - type: "console_log"
@@ -286,7 +312,7 @@ hooks:
     #   config:
     #     target_language: "es"
     #     service: "command"
-    #     command: "trans -brief en:es '{text}'"
+    #     command: ["trans", "-brief", "en:es", "{text}"]
     #     print_translation: true
     #
     # Example: OpenAI translation hook
@@ -313,7 +339,7 @@ hooks:
     # - type: "command"
     #   enabled: true
     #   config:
-    #     command: "echo 'Transcribed: {text}' | notify-send"
+    #     command: ["notify-send", "Transcribed: {text}"]
     #     timeout: 10
     #
     # Example: Webhook hook
@@ -349,6 +375,11 @@ hooks:
         trans_tree.add(f"Device: {self.config.transcription.device}")
         trans_tree.add(f"Compute Type: {self.config.transcription.compute_type}")
         trans_tree.add(f"Confidence Threshold: {self.config.transcription.confidence_threshold}")
+        trans_tree.add(f"Warmup: {self.config.transcription.warmup}")
+        trans_tree.add(f"CPU Threads: {self.config.transcription.cpu_threads or 'auto'}")
+        trans_tree.add(f"Workers: {self.config.transcription.num_workers}")
+        trans_tree.add(f"Batch Size: {self.config.transcription.batch_size or 'off'}")
+        trans_tree.add(f"Initial Prompt: {self.config.transcription.initial_prompt or 'none'}")
         
         # Output section
         output_tree = tree.add("📄 Output")
@@ -365,6 +396,7 @@ hooks:
         display_tree.add(f"Max Lines: {self.config.display.max_lines}")
         display_tree.add(f"Show Stats: {self.config.display.show_stats}")
         display_tree.add(f"Update Interval: {self.config.display.update_interval}s")
+        display_tree.add(f"Full Screen: {self.config.display.full_screen}")
         display_tree.add(f"Color Scheme: {self.config.display.color_scheme}")
         
         # Models section
@@ -380,6 +412,9 @@ hooks:
         # Hooks section
         hooks_tree = tree.add("🪝 Hooks")
         hooks_tree.add(f"Enabled: {self.config.hooks.enabled}")
+        if self.config.hooks.filters:
+            filters = ", ".join(f"{k}={v}" for k, v in self.config.hooks.filters.items())
+            hooks_tree.add(f"Filters: {filters}")
         if self.config.hooks.hooks:
             hooks_list_tree = hooks_tree.add("Configured Hooks")
             for i, hook in enumerate(self.config.hooks.hooks):
@@ -407,6 +442,14 @@ hooks:
             self.config.transcription.model_size = kwargs['model']
         if 'language' in kwargs and kwargs['language'] is not None:
             self.config.transcription.language = kwargs['language']
+        if 'compute_type' in kwargs and kwargs['compute_type'] is not None:
+            self.config.transcription.compute_type = kwargs['compute_type']
+        if 'warmup' in kwargs and kwargs['warmup'] is not None:
+            self.config.transcription.warmup = kwargs['warmup']
+        if 'cpu_threads' in kwargs and kwargs['cpu_threads'] is not None:
+            self.config.transcription.cpu_threads = kwargs['cpu_threads']
+        if 'initial_prompt' in kwargs and kwargs['initial_prompt'] is not None:
+            self.config.transcription.initial_prompt = kwargs['initial_prompt']
         
         # Output settings
         if 'timestamps' in kwargs and kwargs['timestamps'] is not None:
@@ -0,0 +1,14 @@
+"""Shared Rich console, created on first use."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def get_console():
+    """Return the shared Rich console.
+    
+    Rich is imported and the terminal probed only when something is printed,
+    keeping both off the import path of modules that merely might print.
+    """
+    from rich.console import Console
+    return Console()
@@ -1,13 +1,16 @@
 """Logging configuration for newear."""
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from rich.console import Console
-from rich.logging import RichHandler
 from rich.traceback import install as install_rich_traceback
 
 # Install rich traceback handler
@@ -16,8 +19,24 @@ install_rich_traceback(show_locals=True)
 console = Console()
 
 
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that passes records through unformatted.
+    
+    The stock prepare() formats the message and drops exc_info, so the
+    listener's RichHandler could only print a flattened traceback. The
+    queue is in-process, so the record can be handed over as is.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
 class NewearLogger:
-    """Centralized logging for newear."""
+    """Centralized logging for newear.
+    
+    Records are put on a queue and written by a background listener, so
+    callers on the audio/transcription path never block on console or file I/O.
+    """
     
     def __init__(self, name: str = "newear", level: str = "INFO", 
                  log_file: Optional[Path] = None, enable_rich: bool = True):
@@ -27,18 +46,24 @@ class NewearLogger:
         self.log_file = log_file
         self.enable_rich = enable_rich
         self.logger = None
+        self._listener: Optional[QueueListener] = None
         self.setup_logging()
     
     def setup_logging(self):
         """Setup logging configuration."""
+        self.stop()
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(getattr(logging, self.level.upper()))
         
         # Clear existing handlers
         self.logger.handlers.clear()
+        handlers = []
+        file_error = None
         
         # Console handler
         if self.enable_rich:
+            # Only pulled in when used; plain output skips rich's log renderer
+            from rich.logging import RichHandler
             console_handler = RichHandler(
                 console=console,
                 show_time=True,
@@ -53,7 +78,7 @@ class NewearLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler
         if self.log_file:
@@ -64,9 +89,27 @@ class NewearLogger:
                     '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
                 )
                 file_handler.setFormatter(file_formatter)
-                self.logger.addHandler(file_handler)
+                handlers.append(file_handler)
             except Exception as e:
-                self.logger.warning(f"Could not setup file logging: {e}")
+                file_error = e
+        
+        # Hand records to a background thread that owns the real handlers
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(_RecordQueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        # Registered while the listener runs; stop() removes it again
+        atexit.register(self.stop)
+        
+        if file_error is not None:
+            self.logger.warning("Could not setup file logging: %s", file_error)
+    
+    def stop(self):
+        """Flush queued records and stop the background listener."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            atexit.unregister(self.stop)
     
     def get_logger(self) -> logging.Logger:
         """Get the configured logger."""
@@ -130,6 +173,8 @@ def setup_logging(level: str = "INFO", log_file: Optional[Path] = None,
                  enable_rich: bool = True) -> NewearLogger:
     """Setup logging configuration."""
     global _logger_instance
+    if _logger_instance is not None:
+        _logger_instance.stop()
     _logger_instance = NewearLogger(
         name="newear",
         level=level,
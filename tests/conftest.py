@@ -0,0 +1,7 @@
+"""Shared pytest setup."""
+
+import os
+import sys
+
+# Run against the source tree without requiring an install
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
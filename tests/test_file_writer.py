@@ -0,0 +1,116 @@
+"""FileWriter exports must match the output of the original writers."""
+
+import itertools
+import json
+from dataclasses import asdict
+
+import pytest
+
+from newear.output import file_writer
+from newear.output.file_writer import FileWriter, TranscriptEntry
+
+# (text, confidence, start_time, end_time); times are exact in binary so the
+# original truncating formatter and the current rounding one agree
+SAMPLES = [
+    ("hello world", 0.91, 0.0, 1.25),
+    ('quotes " and \\ backslash', None, 1.25, 2.5),
+    ("café — 你好", -0.25, 61.75, 63.0),
+    ("no timing", 0.5, None, None),
+    ("over an hour", 1.0, 3661.5, 3662.125),
+]
+
+
+def _reference_json(entries):
+    """json.dump(..., indent=2) of the entry dicts, as before the rewrite."""
+    return json.dumps([asdict(entry) for entry in entries], indent=2)
+
+
+def _reference_srt_time(seconds):
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millis = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def _reference_srt(entries):
+    parts = []
+    for i, entry in enumerate(entries, 1):
+        if entry.start_time is not None and entry.end_time is not None:
+            start = _reference_srt_time(entry.start_time)
+            end = _reference_srt_time(entry.end_time)
+            parts.append(f"{i}\n{start} --> {end}\n{entry.text}\n\n")
+    return "".join(parts)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic entry timestamps."""
+    ticks = itertools.count(1_700_000_000.0, 0.5)
+    monkeypatch.setattr(file_writer.time, "time", lambda: next(ticks))
+
+
+def _write_samples(keep_in_memory, samples=SAMPLES):
+    writer = FileWriter(show_timestamps=False, keep_in_memory=keep_in_memory)
+    for text, confidence, start, end in samples:
+        writer.write_entry(text, confidence=confidence, start_time=start, end_time=end)
+    return writer
+
+
+def _expected_entries(samples=SAMPLES):
+    ticks = itertools.count(1_700_000_000.0, 0.5)
+    return [TranscriptEntry(next(ticks), text, confidence, start, end)
+            for text, confidence, start, end in samples]
+
+
+@pytest.mark.parametrize("keep_in_memory", [True, False])
+def test_write_json_matches_json_dump(tmp_path, clock, monkeypatch, keep_in_memory):
+    # Byte-for-byte comparison is against the stdlib serializer
+    monkeypatch.setattr(file_writer, "orjson", None)
+    monkeypatch.setattr(file_writer, "_loads", json.loads)
+    writer = _write_samples(keep_in_memory)
+    
+    out = tmp_path / "t.json"
+    writer.write_json(out)
+    
+    assert out.read_text(encoding="utf-8") == _reference_json(_expected_entries())
+
+
+@pytest.mark.parametrize("keep_in_memory", [True, False])
+def test_write_json_parses_to_same_data(tmp_path, clock, keep_in_memory):
+    # Whichever serializer is installed, the decoded document is unchanged
+    writer = _write_samples(keep_in_memory)
+    
+    out = tmp_path / "t.json"
+    writer.write_json(out)
+    
+    assert json.loads(out.read_text(encoding="utf-8")) == json.loads(
+        _reference_json(_expected_entries()))
+
+
+@pytest.mark.parametrize("keep_in_memory", [True, False])
+def test_write_json_empty(tmp_path, keep_in_memory):
+    out = tmp_path / "t.json"
+    FileWriter(show_timestamps=False, keep_in_memory=keep_in_memory).write_json(out)
+    assert out.read_text(encoding="utf-8") == json.dumps([], indent=2)
+
+
+@pytest.mark.parametrize("keep_in_memory", [True, False])
+def test_write_srt_matches_original(tmp_path, clock, keep_in_memory):
+    writer = _write_samples(keep_in_memory)
+    
+    out = tmp_path / "t.srt"
+    writer.write_srt(out)
+    
+    assert out.read_text(encoding="utf-8") == _reference_srt(_expected_entries())
+
+
+@pytest.mark.parametrize("seconds, expected", [
+    # The original truncated (seconds % 1) * 1000 and printed these as
+    # 00:00:00,299 and 00:00:01,000; milliseconds are now rounded
+    (0.3, "00:00:00,300"),
+    (1.001, "00:00:01,001"),
+    (59.9996, "00:01:00,000"),
+])
+def test_srt_time_rounds_milliseconds(seconds, expected):
+    assert FileWriter()._format_srt_time(seconds) == expected
@@ -0,0 +1,44 @@
+"""_render_template must render exactly like str.format."""
+
+import pytest
+
+from newear.hooks.builtin import _compile_template, _render_template
+
+VALUES = {
+    'text': 'hello {world}',
+    'confidence': 0.8765,
+    'chunk_index': 7,
+    'timestamp': 12.5,
+}
+
+
+@pytest.mark.parametrize("template", [
+    "{text}",
+    "[{timestamp}] {text}",
+    "{chunk_index}: {text} ({confidence:.2f})",
+    "{confidence:>10.3f}|{chunk_index:04d}",
+    "{text!r} {text!s}",
+    "{text[0]}{text[6]}",
+    "{{literal braces}} {text} {{}}",
+    "no placeholders at all",
+    "",
+])
+def test_render_matches_str_format(template):
+    assert _render_template(_compile_template(template), VALUES) == template.format(**VALUES)
+
+
+@pytest.mark.parametrize("template", [
+    "{missing}",
+    "{text} {missing}",
+    "{}",
+    "{0}",
+    "{[0]}",
+    "{.real}",
+    "{text",
+    "text}",
+])
+def test_render_raises_like_str_format(template):
+    with pytest.raises(Exception) as expected:
+        template.format(**VALUES)
+    with pytest.raises(type(expected.value)):
+        _render_template(_compile_template(template), VALUES)